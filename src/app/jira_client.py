@@ -2,6 +2,8 @@ import asyncio
 import base64
 import logging
 import re
+import time
+from asyncio import sleep as _sleep
 from typing import NamedTuple
 
 import httpx
@@ -36,6 +38,11 @@ TEAM_GITHUB_LOGIN_TO_JIRA: dict[str, tuple[str, str]] = {
 # bot accounts, or any path that returns a name we recognize as a bot.
 BOT_DISPLAY_NAME_BLOCKLIST: frozenset[str] = frozenset({"testing skyslope"})
 
+# How many times an issue fetch is retried after a 429, and the longest we'll
+# honour a single Retry-After before retrying anyway.
+RATE_LIMIT_MAX_RETRIES = 3
+RATE_LIMIT_MAX_WAIT_SECONDS = 60.0
+
 
 def is_blocked_bot_display_name(name: str | None) -> bool:
     """Return True if `name` matches a known bot account (case-insensitive)."""
@@ -919,6 +926,17 @@ def _extract_bounce_history(
     return events
 
 
+def _header_seconds(headers, name: str) -> float | None:
+    """Parse a numeric rate-limit header, or None if it's absent or malformed."""
+    value = headers.get(name)
+    if not isinstance(value, str):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
 class JiraAuthError(Exception):
     """Raised when Jira returns 401 or 403."""
 
@@ -957,6 +975,11 @@ class JiraClient:
         auth_bytes = f"{self.email}:{self.token}".encode("utf-8")
         self._auth_header = base64.b64encode(auth_bytes).decode("utf-8")
 
+        # Pacing learned from Jira's rate-limit headers. Shared by every
+        # concurrent issue fetch made through this client instance.
+        self._min_request_interval = 0.0
+        self._next_request_at = 0.0
+
     def _parse_auth_error(self, response: httpx.Response) -> tuple[str, str]:
         """
         Parse authentication error from Jira response.
@@ -990,6 +1013,46 @@ class JiraClient:
             "Authorization": f"Basic {self._auth_header}",
         }
 
+    async def _wait_for_request_slot(self) -> None:
+        """Claim the next request slot, sleeping until it opens if Jira asked us to pace."""
+        now = time.monotonic()
+        slot = max(now, self._next_request_at)
+        self._next_request_at = slot + self._min_request_interval
+        if slot > now:
+            await _sleep(slot - now)
+
+    async def _get_with_rate_limit(
+        self, client: httpx.AsyncClient, url: str, **kwargs
+    ) -> httpx.Response:
+        """
+        GET that follows Jira's rate-limit guidance.
+
+        Once Jira sends x-ratelimit-interval-seconds and x-ratelimit-fillrate,
+        requests are spaced by their quotient. A 429 is retried after its
+        Retry-After (exponential backoff if absent); the backoff is applied to
+        the shared slot so concurrent fetches on this client hold off too.
+        """
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            await self._wait_for_request_slot()
+            r = await client.get(url, **kwargs)
+
+            interval = _header_seconds(r.headers, "x-ratelimit-interval-seconds")
+            fill_rate = _header_seconds(r.headers, "x-ratelimit-fillrate")
+            if interval and fill_rate:
+                self._min_request_interval = interval / fill_rate
+
+            if r.status_code != 429 or attempt == RATE_LIMIT_MAX_RETRIES:
+                break
+
+            retry_after = _header_seconds(r.headers, "retry-after")
+            delay = min(
+                retry_after if retry_after is not None else 2.0**attempt,
+                RATE_LIMIT_MAX_WAIT_SECONDS,
+            )
+            logger.warning(f"Jira rate limit hit for {url}; retrying in {delay:.1f}s")
+            self._next_request_at = max(self._next_request_at, time.monotonic() + delay)
+        return r
+
     async def _get_development_info(
         self, issue_id: str, issue_key: str
     ) -> DevelopmentInfo | None:
@@ -2228,7 +2291,9 @@ class JiraClient:
 
         try:
             async with httpx.AsyncClient(timeout=20) as client:
-                r = await client.get(url, headers=self._headers(), params=params)
+                r = await self._get_with_rate_limit(
+                    client, url, headers=self._headers(), params=params
+                )
         except (httpx.ConnectError, httpx.TimeoutException) as exc:
             raise JiraConnectionError(f"Failed to reach Jira: {exc}") from exc
 
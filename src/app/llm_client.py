@@ -11,11 +11,17 @@ Switch providers by changing LLM_PROVIDER in .env
 import json
 import re
 from abc import ABC, abstractmethod
+from asyncio import sleep as _sleep
 from dataclasses import is_dataclass
 from typing import Any
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # optional: faster encoding of large request bodies
+    orjson = None
+
 from .config import settings
 from .confluence_client import ConfluenceClient, ConfluencePage
 from .description_analyzer import extract_acceptance_criteria, extract_ac_action_facets
@@ -599,6 +605,8 @@ Example title: `[Voice output] Agent reads captured currency amounts in natural
 """
 
 
+# Changing this prompt changes generated plans: bump PLAN_CACHE_VERSION in
+# src/cli/plan_cache.py so the CLI stops reusing plans cached by older code.
 SYSTEM_PROMPT = """You are an expert QA engineer with 10+ years of experience creating comprehensive test plans. Your role is to generate thorough, actionable test cases that catch bugs before they reach production.
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -1447,6 +1455,38 @@ Before generating each section, mentally sort your tests:
 Generate the test plan now. Remember: SORT BY PRIORITY FIRST and ONLY TEST WHAT IS EXPLICITLY MENTIONED."""
 
 
+def _log_prompt_cache_usage(data: dict, label: str) -> None:
+    """Log how much of the cached system-prompt prefix a Claude call reused.
+
+    SYSTEM_PROMPT (and the tool schema ahead of it) is sent with
+    cache_control, so repeat generations within the cache TTL should show
+    cache_read_input_tokens > 0. Useful for checking that nothing dynamic has
+    leaked into the cached prefix.
+    """
+    usage = data.get("usage") or {}
+    import logging
+    logging.getLogger(__name__).info(
+        f"Claude usage for {label}: input={usage.get('input_tokens', 0)} "
+        f"cache_read={usage.get('cache_read_input_tokens', 0)} "
+        f"cache_write={usage.get('cache_creation_input_tokens', 0)} "
+        f"output={usage.get('output_tokens', 0)}"
+    )
+
+
+def _encode_json_body(payload: dict) -> bytes:
+    """Encode a request body the way httpx's json= does, via orjson when installed.
+
+    Test-plan requests carry the full prompt (with the development info
+    rendered into it) plus up to three base64 images, so this is the largest
+    JSON encode on the generation path.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(
+        payload, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+    ).encode("utf-8")
+
+
 class LLMError(Exception):
     """Base exception for LLM-related errors."""
 
@@ -3528,7 +3568,7 @@ class ClaudeClient(LLMClient):
                         "x-api-key": self.api_key,
                         "content-type": "application/json",
                     },
-                    json={
+                    content=_encode_json_body({
                         "model": self.model,
                         # 8192 wasn't enough once the prompt grew (UI grounding,
                         # AC conflict resolution) — happy_path consumed the whole
@@ -3546,11 +3586,12 @@ class ClaudeClient(LLMClient):
                         **self._temperature_kwargs(0.1),
                         "tools": [SUBMIT_TEST_PLAN_TOOL],
                         "tool_choice": {"type": "tool", "name": "submit_test_plan"},
-                    },
+                    }),
                 )
                 response.raise_for_status()
 
                 data = response.json()
+                _log_prompt_cache_usage(data, ticket_key)
                 # When Anthropic hits the output cap, the JSON inside the
                 # tool_use block is silently truncated — usually `happy_path`
                 # is full but `edge_cases`/`integration_tests`/`regression`
@@ -3652,7 +3693,7 @@ class ClaudeClient(LLMClient):
                         "x-api-key": self.api_key,
                         "content-type": "application/json",
                     },
-                    json={
+                    content=_encode_json_body({
                         "model": self.model,
                         # 8192 wasn't enough once the prompt grew (UI grounding,
                         # AC conflict resolution) — happy_path consumed the whole
@@ -3670,11 +3711,14 @@ class ClaudeClient(LLMClient):
                         **self._temperature_kwargs(0.1),
                         "tools": [SUBMIT_TEST_PLAN_TOOL],
                         "tool_choice": {"type": "tool", "name": "submit_test_plan"},
-                    },
+                    }),
                 )
                 response.raise_for_status()
 
                 data = response.json()
+                _log_prompt_cache_usage(
+                    data, ", ".join(t.get("ticket_key", "?") for t in tickets)
+                )
                 # When Anthropic hits the output cap, the JSON inside the
                 # tool_use block is silently truncated — usually `happy_path`
                 # is full but `edge_cases`/`integration_tests`/`regression`
@@ -3772,8 +3816,6 @@ class ClaudeClient(LLMClient):
 
     async def summarize_ticket(self, summary: str, description: str | None) -> str:
         """Return a plain-language summary using Claude API."""
-        import asyncio
-
         desc_part = f"\n\nDescription:\n{description}" if description else ""
         prompt = (
             f"Summarize this Jira ticket in 2-3 plain sentences that a tester can quickly read. "
@@ -3811,7 +3853,7 @@ class ClaudeClient(LLMClient):
             except httpx.HTTPStatusError as e:
                 last_status = e.response.status_code
                 if last_status in retryable_statuses and attempt < max_attempts - 1:
-                    await asyncio.sleep(backoff_seconds * (2 ** attempt))
+                    await _sleep(backoff_seconds * (2 ** attempt))
                     continue
                 if last_status == 529:
                     raise LLMError(
@@ -3824,7 +3866,7 @@ class ClaudeClient(LLMClient):
                 ) from e
             except httpx.TimeoutException as e:
                 if attempt < max_attempts - 1:
-                    await asyncio.sleep(backoff_seconds * (2 ** attempt))
+                    await _sleep(backoff_seconds * (2 ** attempt))
                     continue
                 raise LLMError("Claude API request timed out", error_type="service_unavailable") from e
 
@@ -3840,8 +3882,6 @@ class ClaudeClient(LLMClient):
         reason_text: str,
     ) -> str:
         """One-sentence bounce-reason headline via Claude API."""
-        import asyncio
-
         prompt = self._build_bounce_reason_prompt(from_status, to_status, reason_text)
 
         retryable_statuses = {502, 503, 504, 529}
@@ -3872,7 +3912,7 @@ class ClaudeClient(LLMClient):
             except httpx.HTTPStatusError as e:
                 last_status = e.response.status_code
                 if last_status in retryable_statuses and attempt < max_attempts - 1:
-                    await asyncio.sleep(backoff_seconds * (2 ** attempt))
+                    await _sleep(backoff_seconds * (2 ** attempt))
                     continue
                 if last_status == 529:
                     raise LLMError(
@@ -3885,7 +3925,7 @@ class ClaudeClient(LLMClient):
                 ) from e
             except httpx.TimeoutException as e:
                 if attempt < max_attempts - 1:
-                    await asyncio.sleep(backoff_seconds * (2 ** attempt))
+                    await _sleep(backoff_seconds * (2 ** attempt))
                     continue
                 raise LLMError("Claude API request timed out", error_type="service_unavailable") from e
 
@@ -3896,8 +3936,6 @@ class ClaudeClient(LLMClient):
 
     async def summarize_batch(self, tickets: list[dict]) -> dict:
         """Summarize a bundle of related tickets in one Claude call."""
-        import asyncio
-
         if not tickets:
             return {"overview": "", "per_ticket": []}
 
@@ -3932,7 +3970,7 @@ class ClaudeClient(LLMClient):
             except httpx.HTTPStatusError as e:
                 last_status = e.response.status_code
                 if last_status in retryable_statuses and attempt < max_attempts - 1:
-                    await asyncio.sleep(backoff_seconds * (2 ** attempt))
+                    await _sleep(backoff_seconds * (2 ** attempt))
                     continue
                 if last_status == 529:
                     raise LLMError(
@@ -3945,7 +3983,7 @@ class ClaudeClient(LLMClient):
                 ) from e
             except httpx.TimeoutException as e:
                 if attempt < max_attempts - 1:
-                    await asyncio.sleep(backoff_seconds * (2 ** attempt))
+                    await _sleep(backoff_seconds * (2 ** attempt))
                     continue
                 raise LLMError("Claude API request timed out", error_type="service_unavailable") from e
 
@@ -220,13 +220,7 @@ async def get_issue(issue_key: str):
         # Serialize development info if available
         development_info_dict = None
         if issue.development_info:
-            development_info_dict = {
-                "commits": [asdict(commit) for commit in issue.development_info.commits],
-                "pull_requests": [asdict(pr) for pr in issue.development_info.pull_requests],
-                "branches": issue.development_info.branches,
-                "repository_context": asdict(issue.development_info.repository_context) if issue.development_info.repository_context else None,
-                "figma_context": asdict(issue.development_info.figma_context) if issue.development_info.figma_context else None,
-            }
+            development_info_dict = issue.development_info.as_dict
 
         # Serialize attachments if available
         attachments_list = None
@@ -5,7 +5,8 @@ This module contains all Pydantic and dataclass models used throughout the appli
 """
 
 import re
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from functools import cached_property
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -142,6 +143,16 @@ class DevelopmentInfo:
     repository_context: RepositoryContext | None = None  # Repository documentation
     figma_context: FigmaContext | None = None  # Figma design context
 
+    @cached_property
+    def as_dict(self) -> dict:
+        """
+        Dict form of this development info, as passed to the prompt builder.
+
+        Built with asdict() on first access and cached; development info is
+        not modified after the Jira fetch, so callers must treat it as read-only.
+        """
+        return asdict(self)
+
 
 @dataclass
 class JiraComment:
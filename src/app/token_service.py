@@ -12,7 +12,9 @@ Provides detailed status information including:
 - Service availability and rate limits
 """
 
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -54,10 +56,22 @@ class TokenHealthService:
     def __init__(self):
         self.timeout = 10.0  # seconds
 
-    async def validate_jira_token(self) -> TokenStatus:
+    @asynccontextmanager
+    async def _client(self, client: httpx.AsyncClient | None):
+        """Yield the caller's shared client, or a one-off client closed on exit."""
+        if client is not None:
+            yield client
+            return
+        async with httpx.AsyncClient(timeout=self.timeout) as own_client:
+            yield own_client
+
+    async def validate_jira_token(self, client: httpx.AsyncClient | None = None) -> TokenStatus:
         """
         Validate Jira API token by making a test API call.
 
+        Args:
+            client: Shared HTTP client; a one-off client is used if omitted
+
         Returns:
             TokenStatus with validation result
         """
@@ -82,7 +96,7 @@ class TokenHealthService:
             auth_bytes = f"{settings.jira_username}:{settings.jira_api_token}".encode("utf-8")
             auth_header = base64.b64encode(auth_bytes).decode("utf-8")
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._client(client) as client:
                 response = await client.get(
                     f"{settings.jira_url.rstrip('/')}/rest/api/2/myself",
                     headers={
@@ -182,10 +196,13 @@ class TokenHealthService:
                 last_checked=last_checked,
             )
 
-    async def validate_github_token(self) -> TokenStatus:
+    async def validate_github_token(self, client: httpx.AsyncClient | None = None) -> TokenStatus:
         """
         Validate GitHub personal access token.
 
+        Args:
+            client: Shared HTTP client; a one-off client is used if omitted
+
         Returns:
             TokenStatus with validation result
         """
@@ -205,7 +222,7 @@ class TokenHealthService:
             )
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._client(client) as client:
                 response = await client.get(
                     "https://api.github.com/user",
                     headers={
@@ -329,10 +346,13 @@ class TokenHealthService:
                 last_checked=last_checked,
             )
 
-    async def validate_anthropic_token(self) -> TokenStatus:
+    async def validate_anthropic_token(self, client: httpx.AsyncClient | None = None) -> TokenStatus:
         """
         Validate Anthropic/Claude API key.
 
+        Args:
+            client: Shared HTTP client; a one-off client is used if omitted
+
         Returns:
             TokenStatus with validation result
         """
@@ -364,7 +384,7 @@ class TokenHealthService:
         try:
             # Make a minimal API call to validate the key
             # Using a very small prompt to minimize cost
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._client(client) as client:
                 response = await client.post(
                     "https://api.anthropic.com/v1/messages",
                     headers={
@@ -464,10 +484,13 @@ class TokenHealthService:
                 last_checked=last_checked,
             )
 
-    async def validate_figma_token(self) -> TokenStatus:
+    async def validate_figma_token(self, client: httpx.AsyncClient | None = None) -> TokenStatus:
         """
         Validate Figma personal access token.
 
+        Args:
+            client: Shared HTTP client; a one-off client is used if omitted
+
         Returns:
             TokenStatus with validation result
         """
@@ -486,7 +509,7 @@ class TokenHealthService:
             )
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._client(client) as client:
                 response = await client.get(
                     "https://api.figma.com/v1/me",
                     headers={"X-FIGMA-TOKEN": settings.figma_token},
@@ -589,28 +612,42 @@ class TokenHealthService:
         """
         Validate all configured API tokens.
 
+        All four services are checked concurrently over one shared HTTP client.
+        A validator that raises is reported as that service being unavailable
+        rather than dropped, so callers always get one status per service.
+
         Returns:
             List of TokenStatus for all services
         """
-        # Validate all services concurrently
-        import asyncio
-
-        results = await asyncio.gather(
-            self.validate_jira_token(),
-            self.validate_github_token(),
-            self.validate_anthropic_token(),
-            self.validate_figma_token(),
-            return_exceptions=True,
+        checks = (
+            ("Jira", True, self.validate_jira_token),
+            ("GitHub", False, self.validate_github_token),
+            ("Claude (Anthropic)", settings.llm_provider.lower() == "claude", self.validate_anthropic_token),
+            ("Figma", False, self.validate_figma_token),
         )
 
-        # Filter out any exceptions and return valid results
-        token_statuses = []
-        for result in results:
-            if isinstance(result, TokenStatus):
-                token_statuses.append(result)
-            else:
-                logger.error(f"Error during token validation: {result}")
+        async def run_check(service_name, is_required, validate, client) -> TokenStatus:
+            try:
+                return await validate(client)
+            except Exception as e:
+                logger.error(f"Error during {service_name} token validation: {e}")
+                return TokenStatus(
+                    service_name=service_name,
+                    is_valid=False,
+                    is_required=is_required,
+                    error_type=TokenErrorType.SERVICE_UNAVAILABLE,
+                    error_message=f"Could not validate {service_name} token: {e}",
+                    last_checked=datetime.now(),
+                )
+
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(run_check(service_name, is_required, validate, client))
+                    for service_name, is_required, validate in checks
+                ]
 
+        token_statuses = [task.result() for task in tasks]
         return token_statuses
 
 
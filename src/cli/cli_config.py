@@ -1,12 +1,36 @@
 """Configuration management for CLI."""
 
 import os
+import re
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Optional
 
 import yaml
 from pydantic import BaseModel, Field
 
+# KEY=VALUE line in a .env file: optional single/double quotes around the
+# value and an optional whitespace-separated trailing "# comment".
+_ENV_LINE_RE = re.compile(
+    r"""^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(?:"([^"]*)"|'([^']*)'|(.*?))(?:\s+#.*)?\s*$"""
+)
+
+# (config field, environment variable read by the app's Settings)
+_ENV_VARS = (
+    ("jira_url", "JIRA_URL"),
+    ("jira_email", "JIRA_USERNAME"),
+    ("jira_token", "JIRA_API_TOKEN"),
+    ("anthropic_key", "ANTHROPIC_API_KEY"),
+    ("github_token", "GITHUB_TOKEN"),
+    ("figma_token", "FIGMA_TOKEN"),
+)
+
+# Fixed LLM settings the CLI always runs with
+_STATIC_ENV = {
+    "LLM_PROVIDER": "claude",
+    "LLM_MODEL": "claude-opus-4-5-20251101",
+}
+
 
 class CLIConfig(BaseModel):
     """CLI configuration model."""
@@ -27,10 +51,15 @@ class CLIConfig(BaseModel):
 class ConfigManager:
     """Manages CLI configuration stored in ~/.config/jira-testplan/config.yaml"""
 
-    def __init__(self):
-        """Initialize config manager with default config directory."""
-        self.config_dir = Path.home() / ".config" / "jira-testplan"
-        self.config_file = self.config_dir / "config.yaml"
+    @cached_property
+    def config_dir(self) -> Path:
+        """Config directory, resolved on first use rather than at import."""
+        return Path.home() / ".config" / "jira-testplan"
+
+    @cached_property
+    def config_file(self) -> Path:
+        """Path to the YAML config file."""
+        return self.config_dir / "config.yaml"
 
     def ensure_config_dir(self) -> None:
         """Ensure config directory exists."""
@@ -53,24 +82,15 @@ class ConfigManager:
             data = {}
 
         # Apply environment variable fallback for missing values
-        # Map config keys to environment variable names
-        env_mapping = {
-            "jira_url": "JIRA_URL",
-            "jira_email": "JIRA_USERNAME",
-            "jira_token": "JIRA_API_TOKEN",
-            "anthropic_key": "ANTHROPIC_API_KEY",
-            "github_token": "GITHUB_TOKEN",
-            "figma_token": "FIGMA_TOKEN",
-        }
-
-        for config_key, env_var in env_mapping.items():
+        for config_key, env_var in _ENV_VARS:
             # Only use env var if config value is not set
             if not data.get(config_key):
                 env_value = os.getenv(env_var)
                 if env_value:
                     data[config_key] = env_value
 
-        return CLIConfig(**data)
+        # Validated, since the YAML may have been edited by hand
+        return CLIConfig.model_validate(data)
 
     def save(self, config: CLIConfig) -> None:
         """Save configuration to file."""
@@ -117,59 +137,46 @@ class ConfigManager:
         config = self.load()
 
         # Map environment variable names to config keys
-        env_to_config = {
-            "JIRA_URL": "jira_url",
-            "JIRA_USERNAME": "jira_email",
-            "JIRA_API_TOKEN": "jira_token",
-            "ANTHROPIC_API_KEY": "anthropic_key",
-            "GITHUB_TOKEN": "github_token",
-            "FIGMA_TOKEN": "figma_token",
-        }
+        env_to_config = {env_var: config_key for config_key, env_var in _ENV_VARS}
 
         imported = []
         skipped = []
 
         # Parse .env file
-        with open(env_file_path, "r") as f:
-            for line in f:
-                line = line.strip()
-
-                # Skip comments and empty lines
-                if not line or line.startswith("#"):
+        text = env_file_path.read_text()
+        for line in text.splitlines():
+            match = _ENV_LINE_RE.match(line)
+            if not match:
+                continue
+
+            key = match.group(1)
+            value = match.group(2) or match.group(3) or match.group(4) or ""
+
+            # Check if this is a key we care about
+            if key in env_to_config:
+                config_key = env_to_config[key]
+                # Skip if value is empty or placeholder
+                if not value or value in ["your-token-here", "your-key-here", ""]:
+                    skipped.append(key)
                     continue
 
-                # Parse KEY=VALUE format
-                if "=" not in line:
-                    continue
+                # Set the value
+                setattr(config, config_key, value)
+                imported.append(key)
 
-                key, _, value = line.partition("=")
-                key = key.strip()
-                value = value.strip()
-
-                # Remove quotes if present
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.startswith("'") and value.endswith("'"):
-                    value = value[1:-1]
-
-                # Check if this is a key we care about
-                if key in env_to_config:
-                    config_key = env_to_config[key]
-                    # Skip if value is empty or placeholder
-                    if not value or value in ["your-token-here", "your-key-here", ""]:
-                        skipped.append(key)
-                        continue
-
-                    # Set the value
-                    setattr(config, config_key, value)
-                    imported.append(key)
-
-        # Save updated config
+        # Save updated config, validating the untrusted .env values first
         if imported:
-            self.save(config)
+            self.save(CLIConfig.model_validate(config.model_dump()))
 
         return {"imported": imported, "skipped": skipped}
 
+    def export_to_env(self, config: CLIConfig) -> None:
+        """Expose the CLI config to the app clients via environment variables."""
+        os.environ.update(
+            {env_var: getattr(config, config_key) or "" for config_key, env_var in _ENV_VARS}
+        )
+        os.environ.update(_STATIC_ENV)
+
     def is_configured(self) -> bool:
         """Check if minimum required configuration exists."""
         config = self.load()
@@ -1,9 +1,27 @@
-"""CLI commands."""
+"""CLI commands.
 
-from .config_cmd import app as config_app
-from .fetch_cmd import fetch
-from .generate_cmd import generate
-from .health_cmd import health
-from .setup_cmd import setup
+Command modules are imported on first attribute access so that running one
+subcommand does not import every other command (and its dependencies).
+"""
+
+import importlib
+
+# Public name -> (submodule, attribute)
+_EXPORTS = {
+    "config_app": ("config_cmd", "app"),
+    "fetch": ("fetch_cmd", "fetch"),
+    "generate": ("generate_cmd", "generate"),
+    "health": ("health_cmd", "health"),
+    "setup": ("setup_cmd", "setup"),
+}
 
 __all__ = ["config_app", "health", "fetch", "generate", "setup"]
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attr = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(f".{module_name}", __name__)
+    return getattr(module, attr)
@@ -1,20 +1,38 @@
 """Config command for managing CLI configuration."""
 
+from typing import Annotated
+
 import typer
 from rich.console import Console
 from rich.table import Table
-from typing_extensions import Annotated
 
 from ..cli_config import config_manager
 
-app = typer.Typer(help="Manage CLI configuration")
+app = typer.Typer(help="Manage CLI configuration", no_args_is_help=True, add_completion=False)
 console = Console()
 
+# Argument metadata shared by the set/get/unset subcommands, built once
+# instead of once per decorated signature.
+_KeyArg = Annotated[str, typer.Argument(help="Configuration key (e.g. jira-url)")]
+_ValueArg = Annotated[str, typer.Argument(help="Configuration value")]
+
+_VALID_KEYS = frozenset(
+    {
+        "jira-url",
+        "jira-email",
+        "jira-token",
+        "anthropic-key",
+        "github-token",
+        "figma-token",
+    }
+)
+_VALID_KEYS_STR = ", ".join(sorted(_VALID_KEYS))
+
 
 @app.command(name="set")
 def config_set(
-    key: Annotated[str, typer.Argument(help="Configuration key to set")],
-    value: Annotated[str, typer.Argument(help="Configuration value")],
+    key: _KeyArg,
+    value: _ValueArg,
 ):
     """
     Set a configuration value.
@@ -27,18 +45,9 @@ def config_set(
         testplan config set github-token "ghp_..."
         testplan config set figma-token "figd_..."
     """
-    valid_keys = [
-        "jira-url",
-        "jira-email",
-        "jira-token",
-        "anthropic-key",
-        "github-token",
-        "figma-token",
-    ]
-
-    if key not in valid_keys:
+    if key not in _VALID_KEYS:
         console.print(
-            f"[red]Error:[/red] Invalid key '{key}'. Valid keys: {', '.join(valid_keys)}"
+            f"[red]Error:[/red] Invalid key '{key}'. Valid keys: {_VALID_KEYS_STR}"
         )
         raise typer.Exit(1)
 
@@ -52,7 +61,7 @@ def config_set(
 
 @app.command(name="get")
 def config_get(
-    key: Annotated[str, typer.Argument(help="Configuration key to get")],
+    key: _KeyArg,
 ):
     """
     Get a configuration value.
@@ -139,7 +148,7 @@ def config_show():
 
 @app.command(name="unset")
 def config_unset(
-    key: Annotated[str, typer.Argument(help="Configuration key to unset")],
+    key: _KeyArg,
 ):
     """
     Unset (remove) a configuration value.
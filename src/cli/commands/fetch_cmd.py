@@ -1,13 +1,14 @@
 """Fetch command for retrieving Jira ticket details."""
 
 import asyncio
+from typing import Annotated
 
 import typer
-from rich.console import Console
-from rich.markdown import Markdown
+from rich.console import Console, Group
+from rich.markup import escape
 from rich.panel import Panel
 from rich.table import Table
-from typing_extensions import Annotated
+from rich.text import Text
 
 from ..cli_config import config_manager
 from ...app.jira_client import (
@@ -46,11 +47,7 @@ def fetch(
     config = config_manager.load()
 
     # Set environment variables for Jira client
-    import os
-
-    os.environ["JIRA_URL"] = config.jira_url or ""
-    os.environ["JIRA_USERNAME"] = config.jira_email or ""
-    os.environ["JIRA_API_TOKEN"] = config.jira_token or ""
+    config_manager.export_to_env(config)
 
     # Fetch ticket
     with console.status(
@@ -72,30 +69,30 @@ def fetch(
             console.print(f"[red]✗ Connection error:[/red] {e}")
             raise typer.Exit(1)
 
-    # Display ticket information
-    console.print()
-    console.print(
+    # Build all output first and render it in a single print call
+    parts = [
+        Text(),
         Panel(
             f"[bold cyan]{issue.key}[/bold cyan]: {issue.summary}",
             title=f"[bold]{issue.issue_type}[/bold]",
             border_style="blue",
-        )
-    )
+        ),
+    ]
 
     # Display labels if present
     if issue.labels:
-        console.print(f"\n[bold]Labels:[/bold] {', '.join(issue.labels)}")
+        parts.append(Text.from_markup(f"\n[bold]Labels:[/bold] {', '.join(issue.labels)}"))
 
     # Display description
     if issue.description:
-        console.print("\n[bold]Description:[/bold]")
+        parts.append(Text.from_markup("\n[bold]Description:[/bold]"))
         # Truncate very long descriptions
         description = issue.description
         if len(description) > 1000:
             description = description[:1000] + "\n... (truncated)"
-        console.print(Panel(description, border_style="dim"))
+        parts.append(Panel(description, border_style="dim"))
     else:
-        console.print("\n[yellow]No description available[/yellow]")
+        parts.append(Text.from_markup("\n[yellow]No description available[/yellow]"))
 
     # Display development info
     if issue.development_info:
@@ -103,7 +100,9 @@ def fetch(
 
         # PRs
         if dev_info.pull_requests:
-            console.print(f"\n[bold]Pull Requests ({len(dev_info.pull_requests)}):[/bold]")
+            parts.append(
+                Text.from_markup(f"\n[bold]Pull Requests ({len(dev_info.pull_requests)}):[/bold]")
+            )
             pr_table = Table(show_header=True, box=None)
             pr_table.add_column("Status", style="cyan")
             pr_table.add_column("Title")
@@ -117,22 +116,27 @@ def fetch(
                     pr.source_branch or "",
                 )
 
-            console.print(pr_table)
+            parts.append(pr_table)
 
         # Commits
         if dev_info.commits:
-            console.print(f"\n[bold]Commits ({len(dev_info.commits)}):[/bold]")
+            commit_lines = [f"\n[bold]Commits ({len(dev_info.commits)}):[/bold]"]
             for commit in dev_info.commits[:5]:  # Show first 5 commits
                 commit_msg = commit.message.split("\n")[0]  # First line only
                 if len(commit_msg) > 70:
                     commit_msg = commit_msg[:70] + "..."
-                console.print(f"  • {commit_msg}")
-                console.print(f"    [dim]{commit.author} - {commit.date}[/dim]")
+                commit_lines.append(f"  • {escape(commit_msg)}")
+                commit_lines.append(f"    [dim]{escape(f'{commit.author} - {commit.date}')}[/dim]")
+            parts.append(Text.from_markup("\n".join(commit_lines)))
 
         # Branches
         if dev_info.branches:
-            console.print(f"\n[bold]Branches:[/bold] {', '.join(dev_info.branches[:3])}")
+            parts.append(
+                Text.from_markup(f"\n[bold]Branches:[/bold] {', '.join(dev_info.branches[:3])}")
+            )
 
-    console.print(
-        f"\n[dim]View in Jira: {config.jira_url}/browse/{issue.key}[/dim]"
+    parts.append(
+        Text.from_markup(f"\n[dim]View in Jira: {config.jira_url}/browse/{issue.key}[/dim]")
     )
+
+    console.print(Group(*parts))
@@ -1,28 +1,75 @@
 """Generate command for creating test plans."""
 
 import asyncio
+import io
 import json
+import os
+import shutil
+from dataclasses import asdict, fields
+from functools import cache
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Annotated, Callable, List, Optional
 
 import typer
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.syntax import Syntax
-from typing_extensions import Annotated
+
+try:
+    import orjson
+except ImportError:  # optional fast-json extra: faster JSON output when installed
+    orjson = None
 
 from ..cli_config import config_manager
-from ...app.jira_client import (
-    JiraAuthError,
-    JiraClient,
-    JiraConnectionError,
-    JiraNotFoundError,
+from ..plan_cache import plan_cache
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.progress import Progress
+
+    from ...app.jira_client import JiraClient
+    from ...app.llm_client import LLMClient
+    from ...app.models import JiraIssue
+
+_VALID_FORMATS = frozenset({"markdown", "jira", "json"})
+_VALID_FORMATS_STR = "markdown, jira, json"
+
+_SEP_EQ = "=" * 60
+_SEP_DASH = "-" * 60
+
+# Text fragments for the markdown and jira plan formats. Each starts with the
+# newline that separates it from the previous line, so a whole plan is
+# written into a single buffer.
+_FORMAT_LABELS = {
+    "markdown": {
+        "happy_path": "\n## Happy Path Test Cases\n",
+        "edge_cases": "\n## Edge Cases\n",
+        "regression_checklist": "\n## Regression Checklist\n",
+        "title": "\n### Test {i}: {title}\n\n",
+        "manual": "\n> ⚠️ **Needs manual verification** — the AC element referenced here could not be verified in the PR diff or testID reference.\n",
+        "preconditions": "\n**Preconditions:**\n",
+        "steps": "\n**Steps:**",
+        "expected": "\n\n**Expected Result:**\n",
+        "test_data": "\n**Test Data:**\n",
+    },
+    "jira": {
+        "happy_path": f"\nHAPPY PATH TEST CASES\n{_SEP_DASH}\n",
+        "edge_cases": f"\n\nEDGE CASES\n{_SEP_DASH}\n",
+        "regression_checklist": f"\n\nREGRESSION CHECKLIST\n{_SEP_DASH}\n",
+        "title": "\nTest {i}: {title}\n",
+        "manual": "\n⚠ Needs manual verification — AC element not found in PR diff/testID reference.\n",
+        "preconditions": "\nPreconditions:\n",
+        "steps": "\nSteps:",
+        "expected": "\n\nExpected Result:\n",
+        "test_data": "\nTest Data:\n",
+    },
+}
+
+# Clipboard tools in order of preference, with the arguments that make them
+# read the text to copy from stdin.
+_CLIPBOARD_COMMANDS = (
+    ("pbcopy",),
+    ("wl-copy",),
+    ("xclip", "-selection", "clipboard"),
+    ("xsel", "--clipboard", "--input"),
 )
-from ...app.llm_client import LLMError, get_llm_client
-
-console = Console()
 
 
 def generate(
@@ -57,7 +104,7 @@ def generate(
         typer.Option(
             "--copy",
             "-c",
-            help="Copy output to clipboard (requires pbcopy/xclip)",
+            help="Copy output to clipboard (requires pbcopy, wl-copy, xclip or xsel)",
         ),
     ] = False,
     quiet: Annotated[
@@ -76,6 +123,18 @@ def generate(
             help="Show detailed output and API calls",
         ),
     ] = False,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache",
+            help=(
+                "Always regenerate, ignoring cached plans. Plans are reused for 7 days "
+                "while the ticket, dev info, comments, parent/linked issues, bounce "
+                "history, attachments and model are unchanged; linked Confluence "
+                "pages and GitHub repo docs are not checked"
+            ),
+        ),
+    ] = False,
 ):
     """
     Generate comprehensive test plans from Jira tickets.
@@ -93,174 +152,173 @@ def generate(
         testplan generate PROJ-123 -o plan.md
         testplan generate PROJ-123 --post-to-jira
         testplan generate PROJ-123 PROJ-124 PROJ-125
+        testplan generate PROJ-123 --no-cache
     """
-    # Validate format
-    valid_formats = ["markdown", "jira", "json"]
-    if format not in valid_formats:
-        console.print(
-            f"[red]✗ Invalid format:[/red] {format}. Choose from: {', '.join(valid_formats)}"
+    # Validate arguments and configuration before importing rich or the app
+    # clients, so bad input exits without paying for either.
+    if format not in _VALID_FORMATS:
+        typer.echo(
+            typer.style("✗ Invalid format:", fg=typer.colors.RED)
+            + f" {format}. Choose from: {_VALID_FORMATS_STR}"
         )
         raise typer.Exit(1)
 
-    # Check if configuration exists
     if not config_manager.is_configured():
-        console.print("[red]✗ Configuration incomplete![/red]")
-        console.print(
-            "\nRun [cyan]testplan config set[/cyan] to configure your API tokens."
+        typer.secho("✗ Configuration incomplete!", fg=typer.colors.RED)
+        typer.echo(
+            "\nRun " + typer.style("testplan config set", fg=typer.colors.CYAN)
+            + " to configure your API tokens."
         )
         raise typer.Exit(1)
 
-    # Load configuration and set environment variables
-    config = config_manager.load()
-    import os
-
-    os.environ["JIRA_URL"] = config.jira_url or ""
-    os.environ["JIRA_USERNAME"] = config.jira_email or ""
-    os.environ["JIRA_API_TOKEN"] = config.jira_token or ""
-    os.environ["ANTHROPIC_API_KEY"] = config.anthropic_key or ""
-    os.environ["GITHUB_TOKEN"] = config.github_token or ""
-    os.environ["FIGMA_TOKEN"] = config.figma_token or ""
-    os.environ["LLM_PROVIDER"] = "claude"
-    os.environ["LLM_MODEL"] = "claude-opus-4-5-20251101"
-
-    # Process each ticket
-    for ticket_key in ticket_keys:
-        if not quiet:
-            console.print(f"\n[bold blue]Processing {ticket_key}...[/bold blue]")
+    # rich is imported here rather than at module scope so `--help` and
+    # shell completion don't pay for it.
+    from rich.console import Console
 
-        try:
-            # Fetch ticket
-            if verbose:
-                console.print(f"[dim]Fetching ticket from Jira...[/dim]")
+    console = Console()
 
-            jira_client = JiraClient()
-            issue = asyncio.run(jira_client.get_issue(ticket_key))
+    # Load configuration and set environment variables
+    config = config_manager.load()
+    config_manager.export_to_env(config)
+
+    if verbose:
+        # Surface the app's INFO logs: HTTP calls and per-call Claude token
+        # usage, including prompt-cache reads/writes.
+        import logging
+
+        logging.basicConfig(level=logging.INFO, format="%(name)s: %(message)s")
+
+    asyncio.run(
+        _generate_all(
+            console,
+            ticket_keys,
+            output,
+            format,
+            post_to_jira,
+            copy,
+            quiet,
+            verbose,
+            not no_cache,
+        )
+    )
 
-            if not quiet:
-                console.print(f"[green]✓[/green] Ticket fetched: {issue.summary}")
+    if not quiet and len(ticket_keys) > 1:
+        console.print(f"\n[green]✓ Processed {len(ticket_keys)} tickets successfully![/green]")
 
-            # Generate test plan
-            if not quiet:
-                console.print(
-                    "[bold blue]Generating test plan with Claude Opus 4.5...[/bold blue]"
-                )
 
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                task = progress.add_task("Analyzing ticket and generating tests...", total=None)
-
-                # Prepare development info
-                from dataclasses import asdict
-
-                development_info = None
-                if issue.development_info:
-                    development_info = asdict(issue.development_info)
-
-                # Prepare Jira comments
-                comments = None
-                if issue.comments:
-                    comments = [asdict(c) for c in issue.comments]
-
-                # Prepare parent info
-                parent_info = None
-                if issue.parent:
-                    parent_info = asdict(issue.parent)
-
-                # Prepare linked issues info
-                linked_info = None
-                if issue.linked_issues:
-                    linked_info = asdict(issue.linked_issues)
-
-                # Prepare bounce-back history (QA/UAT → ToDo regressions)
-                bounce_history = None
-                if issue.bounce_history:
-                    bounce_history = [asdict(b) for b in issue.bounce_history]
-
-                # Download image attachments
-                images = None
-                if issue.attachments:
-                    jira_client = JiraClient()
-                    images = []
-                    for attachment in issue.attachments[:3]:
-                        image_data = asyncio.run(jira_client.download_image_as_base64(attachment.url))
-                        if image_data:
-                            images.append(image_data)
-                    if not images:
-                        images = None
-
-                # Generate test plan
-                llm_client = get_llm_client()
-                test_plan = asyncio.run(
-                    llm_client.generate_test_plan(
-                        ticket_key=issue.key,
-                        summary=issue.summary,
-                        description=issue.description or "",
-                        testing_context={},
-                        development_info=development_info,
-                        images=images,
-                        comments=comments,
-                        parent_info=parent_info,
-                        linked_info=linked_info,
-                        bounce_history=bounce_history,
-                    )
-                )
-
-                progress.remove_task(task)
+async def _generate_all(
+    console: "Console",
+    ticket_keys: List[str],
+    output: Optional[Path],
+    format: str,
+    post_to_jira: bool,
+    copy: bool,
+    quiet: bool,
+    verbose: bool,
+    use_cache: bool,
+) -> None:
+    """
+    Process every ticket inside a single event loop.
 
-            if not quiet:
-                console.print("[green]✓[/green] Test plan generated successfully!")
+    Up to TESTPLAN_CONCURRENCY tickets (default 3) are fetched and generated
+    at once under the progress spinner. Each ticket's status lines are
+    buffered, and once the spinner is gone they are printed and the plans
+    displayed/saved/posted strictly in the order the tickets were given, so
+    output never interleaves.
+    """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
 
-            # Convert TestPlan dataclass to dict for formatting
-            test_plan_dict = asdict(test_plan)
+    # Imported here, after generate() has exported the CLI config to the
+    # environment, so app settings pick it up and bad arguments exit
+    # without loading the HTTP/LLM client stack.
+    from ...app.jira_client import JiraAuthError, JiraClient, JiraNotFoundError
+    from ...app.llm_client import LLMError, get_llm_client
 
-            # Format output
-            formatted_output = _format_test_plan(test_plan_dict, format, issue.key)
+    # One set of clients for every ticket in the batch
+    try:
+        jira_client = JiraClient()
+    except Exception as e:
+        _report_unexpected_error(console, e, verbose)
+        raise typer.Exit(1)
+    try:
+        llm_client = get_llm_client()
+    except LLMError as e:
+        console.print(f"[red]✗ LLM generation failed:[/red] {e}")
+        raise typer.Exit(1)
 
-            # Handle output
-            if output:
-                # Save to file
-                output.write_text(formatted_output)
-                if not quiet:
-                    console.print(f"[green]✓[/green] Saved to: {output}")
-            elif quiet:
-                # Just print the raw output
-                print(formatted_output)
-            else:
-                # Display in terminal with rich formatting
-                console.print("\n")
-                console.print(Panel(f"[bold]Test Plan for {issue.key}[/bold]", border_style="blue"))
-                console.print()
-
-                if format == "json":
-                    syntax = Syntax(formatted_output, "json", theme="monokai")
-                    console.print(syntax)
-                else:
-                    console.print(Markdown(formatted_output))
-
-            # Copy to clipboard if requested
-            if copy:
-                _copy_to_clipboard(formatted_output)
-                if not quiet:
-                    console.print("[green]✓[/green] Copied to clipboard")
-
-            # Post to Jira if requested
-            if post_to_jira:
-                if verbose:
-                    console.print("[dim]Posting to Jira...[/dim]")
-
-                # Use Jira format for posting
-                jira_formatted = _format_test_plan(test_plan_dict, "jira", issue.key)
-                result = asyncio.run(jira_client.post_comment(issue.key, jira_formatted))
-
-                if not quiet:
-                    if result.get("updated"):
-                        console.print("[green]✓[/green] Test plan updated in Jira")
-                    else:
-                        console.print("[green]✓[/green] Test plan posted to Jira")
+    try:
+        concurrency = max(1, int(os.getenv("TESTPLAN_CONCURRENCY", "3")))
+    except ValueError:
+        concurrency = 3
+    semaphore = asyncio.Semaphore(concurrency)
+
+    # Per ticket, in order: its buffered status lines and either the
+    # (issue, test plan) result or the exception that stopped it
+    outcomes: list[tuple[list[str], object]] = []
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        transient=True,
+    ) as progress:
+
+        async def _bounded(ticket_key: str, log: list[str]):
+            async with semaphore:
+                return await _generate_plan(
+                    log,
+                    progress,
+                    jira_client,
+                    llm_client,
+                    ticket_key,
+                    quiet,
+                    verbose,
+                    use_cache,
+                )
 
+        logs: list[list[str]] = [[] for _ in ticket_keys]
+        tasks = [
+            asyncio.create_task(_bounded(ticket_key, log))
+            for ticket_key, log in zip(ticket_keys, logs)
+        ]
+        try:
+            for log, task in zip(logs, tasks):
+                try:
+                    result = await task
+                except Exception as e:
+                    result = e
+                outcomes.append((log, result))
+                # Anything but a missing ticket in a batch ends the run, so
+                # stop generating plans that would never be shown
+                if isinstance(result, Exception) and not (
+                    isinstance(result, JiraNotFoundError) and len(ticket_keys) > 1
+                ):
+                    break
+        finally:
+            # Stop any tickets still in flight if we bailed out early
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    for ticket_key, (log, result) in zip(ticket_keys, outcomes):
+        for line in log:
+            console.print(line)
+        try:
+            if isinstance(result, Exception):
+                raise result
+            issue, test_plan_dict = result
+            await _emit_plan(
+                console,
+                jira_client,
+                issue,
+                test_plan_dict,
+                output,
+                format,
+                post_to_jira,
+                copy,
+                quiet,
+                verbose,
+            )
         except JiraNotFoundError:
             console.print(f"[red]✗ Ticket not found:[/red] {ticket_key}")
             if len(ticket_keys) == 1:
@@ -273,132 +331,335 @@ def generate(
             console.print(f"[red]✗ LLM generation failed:[/red] {e}")
             raise typer.Exit(1)
         except Exception as e:
-            console.print(f"[red]✗ Unexpected error:[/red] {e}")
-            if verbose:
-                import traceback
-
-                console.print("[dim]" + traceback.format_exc() + "[/dim]")
+            _report_unexpected_error(console, e, verbose)
             raise typer.Exit(1)
 
-    if not quiet and len(ticket_keys) > 1:
-        console.print(f"\n[green]✓ Processed {len(ticket_keys)} tickets successfully![/green]")
 
+def _report_unexpected_error(console: "Console", error: Exception, verbose: bool) -> None:
+    """Print an unexpected failure, with its traceback under --verbose."""
+    console.print(f"[red]✗ Unexpected error:[/red] {error}")
+    if verbose:
+        import traceback
+
+        console.print(
+            "[dim]" + "".join(traceback.format_exception(error)) + "[/dim]"
+        )
 
-def _format_test_plan(test_plan: dict, format: str, ticket_key: str) -> str:
-    """Format test plan based on output format."""
+
+async def _generate_plan(
+    log: list[str],
+    progress: "Progress",
+    jira_client: "JiraClient",
+    llm_client: "LLMClient",
+    ticket_key: str,
+    quiet: bool,
+    verbose: bool,
+    use_cache: bool,
+) -> tuple["JiraIssue", dict]:
+    """
+    Fetch one ticket and return it with its test plan (cached or freshly generated).
+
+    Status lines are appended to log rather than printed, since several
+    tickets run at once; the caller prints them in ticket order.
+    """
+    if not quiet:
+        log.append(f"\n[bold blue]Processing {ticket_key}...[/bold blue]")
+
+    # Fetch ticket
+    if verbose:
+        log.append(f"[dim]Fetching {ticket_key} from Jira...[/dim]")
+
+    issue = await jira_client.get_issue(ticket_key)
+
+    if not quiet:
+        log.append(f"[green]✓[/green] Ticket fetched: {issue.key} — {issue.summary}")
+
+    # Prepare development info (dict form is cached on the dataclass)
+    development_info = None
+    if issue.development_info:
+        development_info = issue.development_info.as_dict
+
+    # Prepare Jira comments
+    comments = None
+    if issue.comments:
+        # Only these fields are read by the prompt builder; skip the
+        # recursive asdict() walk for the rest.
+        comments = [
+            {"author": c.author, "body": c.body, "created": c.created}
+            for c in issue.comments
+        ]
+
+    # Prepare parent info
+    parent_info = None
+    if issue.parent:
+        parent_info = asdict(issue.parent)
+
+    # Prepare linked issues info
+    linked_info = None
+    if issue.linked_issues:
+        linked_info = asdict(issue.linked_issues)
+
+    # Prepare bounce-back history (QA/UAT → ToDo regressions)
+    bounce_history = None
+    if issue.bounce_history:
+        bounce_history = [_shallow_asdict(b) for b in issue.bounce_history]
+
+    attachments = (issue.attachments or [])[:3]
+
+    # Reuse a previous plan if none of the LLM inputs have changed
+    cache_key = plan_cache.make_key(
+        ticket_key=issue.key,
+        summary=issue.summary,
+        description=issue.description or "",
+        development_info=development_info,
+        comments=comments,
+        parent_info=parent_info,
+        linked_info=linked_info,
+        bounce_history=bounce_history,
+        attachments=[attachment.url for attachment in attachments],
+        model=getattr(llm_client, "model", None),
+    )
+    test_plan_dict = plan_cache.get(cache_key) if use_cache else None
+
+    if test_plan_dict is not None:
+        if not quiet:
+            log.append(
+                f"[green]✓[/green] Using cached test plan for {issue.key} "
+                "[dim](ticket unchanged; pass --no-cache to regenerate)[/dim]"
+            )
+        return issue, test_plan_dict
+
+    # Generate test plan
+    if not quiet:
+        log.append(
+            f"[bold blue]Generating test plan for {issue.key} with Claude Opus 4.5...[/bold blue]"
+        )
+
+    task = progress.add_task(
+        f"{issue.key}: Analyzing ticket and generating tests...", total=None
+    )
+    try:
+        # Download image attachments
+        images = None
+        if attachments:
+            # Fetch the (at most 3) images concurrently; failed downloads
+            # come back as None and are dropped.
+            results = await asyncio.gather(
+                *(
+                    jira_client.download_image_as_base64(attachment.url)
+                    for attachment in attachments
+                )
+            )
+            images = [image_data for image_data in results if image_data] or None
+
+        # Generate test plan
+        test_plan = await llm_client.generate_test_plan(
+            ticket_key=issue.key,
+            summary=issue.summary,
+            description=issue.description or "",
+            testing_context={},
+            development_info=development_info,
+            images=images,
+            comments=comments,
+            parent_info=parent_info,
+            linked_info=linked_info,
+            bounce_history=bounce_history,
+        )
+    finally:
+        progress.remove_task(task)
+
+    if not quiet:
+        log.append(f"[green]✓[/green] Test plan generated for {issue.key}")
+
+    # Convert TestPlan dataclass to dict for formatting. Its fields already
+    # hold plain lists/dicts, so there is nothing for asdict() to recurse into.
+    test_plan_dict = _shallow_asdict(test_plan)
+    plan_cache.put(cache_key, test_plan_dict)
+    return issue, test_plan_dict
+
+
+async def _emit_plan(
+    console: "Console",
+    jira_client: "JiraClient",
+    issue: "JiraIssue",
+    test_plan_dict: dict,
+    output: Optional[Path],
+    format: str,
+    post_to_jira: bool,
+    copy: bool,
+    quiet: bool,
+    verbose: bool,
+) -> None:
+    """Display or save a ticket's test plan, then copy/post it as requested."""
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+    from rich.syntax import Syntax
+
+    # Format output (JSON is compact under --quiet, where it's meant for scripts)
+    formatted_output = _format_test_plan(
+        test_plan_dict, format, issue.key, pretty=not quiet
+    )
+
+    # Handle output
+    if output:
+        # Save to file (off the event loop; always UTF-8 so emoji in the
+        # plan survive on platforms with a non-UTF-8 default encoding)
+        await asyncio.to_thread(output.write_text, formatted_output, encoding="utf-8")
+        if not quiet:
+            console.print(f"[green]✓[/green] Saved to: {output}")
+    elif quiet:
+        # Just print the raw output
+        print(formatted_output)
+    else:
+        # Display in terminal with rich formatting
+        console.print("\n")
+        console.print(Panel(f"[bold]Test Plan for {issue.key}[/bold]", border_style="blue"))
+        console.print()
+
+        if format == "json":
+            syntax = Syntax(formatted_output, "json", theme="monokai")
+            console.print(syntax)
+        else:
+            console.print(Markdown(formatted_output))
+
+    # Copy to clipboard if requested
+    if copy:
+        _copy_to_clipboard(console, formatted_output)
+        if not quiet:
+            console.print("[green]✓[/green] Copied to clipboard")
+
+    # Post to Jira if requested
+    if post_to_jira:
+        if verbose:
+            console.print("[dim]Posting to Jira...[/dim]")
+
+        # Use Jira format for posting, reusing the output if it's already Jira
+        jira_formatted = (
+            formatted_output
+            if format == "jira"
+            else _format_test_plan(test_plan_dict, "jira", issue.key)
+        )
+        result = await jira_client.post_comment(issue.key, jira_formatted)
+
+        if not quiet:
+            if result.get("updated"):
+                console.print("[green]✓[/green] Test plan updated in Jira")
+            else:
+                console.print("[green]✓[/green] Test plan posted to Jira")
+
+
+def _shallow_asdict(obj) -> dict:
+    """Convert a dataclass to a dict one level deep, without asdict()'s recursive copy."""
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+
+def _format_test_plan(
+    test_plan: dict, format: str, ticket_key: str, pretty: bool = True
+) -> str:
+    """Format test plan based on output format. pretty only affects JSON."""
     if format == "json":
-        return json.dumps(test_plan, indent=2)
+        return _dump_json(test_plan, pretty)
 
-    # Markdown or Jira format
-    lines = []
+    # Markdown or Jira format. Every format-dependent string comes from one
+    # prebuilt table so the per-test loop below doesn't re-check the format.
+    labels = _FORMAT_LABELS[format]
+
+    buf = io.StringIO()
+    w = buf.write
 
     if format == "markdown":
-        lines.append(f"# Test Plan: {ticket_key}\n")
+        w(f"# Test Plan: {ticket_key}\n")
     else:
         # For Jira format, don't add marker here - jira_client.post_comment() adds it
-        lines.append("=" * 60)
-        lines.append("")
+        w(_SEP_EQ)
+        w("\n")
 
     # Happy Path
     if test_plan.get("happy_path"):
-        if format == "markdown":
-            lines.append("## Happy Path Test Cases\n")
-        else:
-            lines.append("HAPPY PATH TEST CASES")
-            lines.append("-" * 60)
-            lines.append("")
-
-        for i, test in enumerate(test_plan["happy_path"], 1):
-            lines.append(f"### Test {i}: {test['title']}\n" if format == "markdown" else f"Test {i}: {test['title']}")
-            lines.append("")
-            if test.get("needs_manual_verification"):
-                lines.append(
-                    "> ⚠️ **Needs manual verification** — the AC element referenced here could not be verified in the PR diff or testID reference."
-                    if format == "markdown"
-                    else "⚠ Needs manual verification — AC element not found in PR diff/testID reference."
-                )
-                lines.append("")
-            if test.get("preconditions"):
-                lines.append("**Preconditions:**" if format == "markdown" else "Preconditions:")
-                lines.append(test["preconditions"])
-                lines.append("")
-            lines.append("**Steps:**" if format == "markdown" else "Steps:")
-            for step_num, step in enumerate(test.get("steps", []), 1):
-                lines.append(f"{step_num}. {step}")
-            lines.append("")
-            lines.append("**Expected Result:**" if format == "markdown" else "Expected Result:")
-            lines.append(test.get("expected", ""))
-            lines.append("")
-            if test.get("test_data"):
-                lines.append("**Test Data:**" if format == "markdown" else "Test Data:")
-                lines.append(test["test_data"])
-                lines.append("")
+        w(labels["happy_path"])
+        _emit_tests(w, test_plan["happy_path"], labels)
 
     # Edge Cases
     if test_plan.get("edge_cases"):
-        if format == "markdown":
-            lines.append("## Edge Cases\n")
-        else:
-            lines.append("")
-            lines.append("EDGE CASES")
-            lines.append("-" * 60)
-            lines.append("")
-
-        for i, test in enumerate(test_plan["edge_cases"], 1):
-            lines.append(f"### Test {i}: {test['title']}\n" if format == "markdown" else f"Test {i}: {test['title']}")
-            lines.append("")
-            if test.get("needs_manual_verification"):
-                lines.append(
-                    "> ⚠️ **Needs manual verification** — the AC element referenced here could not be verified in the PR diff or testID reference."
-                    if format == "markdown"
-                    else "⚠ Needs manual verification — AC element not found in PR diff/testID reference."
-                )
-                lines.append("")
-            if test.get("preconditions"):
-                lines.append("**Preconditions:**" if format == "markdown" else "Preconditions:")
-                lines.append(test["preconditions"])
-                lines.append("")
-            lines.append("**Steps:**" if format == "markdown" else "Steps:")
-            for step_num, step in enumerate(test.get("steps", []), 1):
-                lines.append(f"{step_num}. {step}")
-            lines.append("")
-            lines.append("**Expected Result:**" if format == "markdown" else "Expected Result:")
-            lines.append(test.get("expected", ""))
-            lines.append("")
-            if test.get("test_data"):
-                lines.append("**Test Data:**" if format == "markdown" else "Test Data:")
-                lines.append(test["test_data"])
-                lines.append("")
+        w(labels["edge_cases"])
+        _emit_tests(w, test_plan["edge_cases"], labels)
 
     # Regression Checklist
     if test_plan.get("regression_checklist"):
-        if format == "markdown":
-            lines.append("## Regression Checklist\n")
-        else:
-            lines.append("")
-            lines.append("REGRESSION CHECKLIST")
-            lines.append("-" * 60)
-            lines.append("")
+        w(labels["regression_checklist"])
 
         for item in test_plan["regression_checklist"]:
-            lines.append(f"- {item}")
+            w(f"\n- {item}")
 
-        lines.append("")
+        w("\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
-def _copy_to_clipboard(text: str) -> None:
-    """Copy text to clipboard using pbcopy (macOS) or xclip (Linux)."""
-    import platform
+def _dump_json(obj: dict, pretty: bool) -> str:
+    """
+    Serialize to JSON with orjson when it's installed, else the stdlib encoder.
+
+    The stdlib path is configured to match orjson byte for byte (raw UTF-8,
+    two-space indent or compact separators), so output doesn't depend on
+    whether the fast-json extra is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode("utf-8")
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def _emit_tests(w: Callable[[str], object], tests: list[dict], labels: dict) -> None:
+    """Write one section's test cases using the given format's labels."""
+    for i, test in enumerate(tests, 1):
+        w(labels["title"].format(i=i, title=test["title"]))
+        if test.get("needs_manual_verification"):
+            w(labels["manual"])
+        if test.get("preconditions"):
+            w(labels["preconditions"])
+            w(test["preconditions"])
+            w("\n")
+        w(labels["steps"])
+        for step_num, step in enumerate(test.get("steps", []), 1):
+            w(f"\n{step_num}. {step}")
+        w(labels["expected"])
+        w(test.get("expected", ""))
+        w("\n")
+        if test.get("test_data"):
+            w(labels["test_data"])
+            w(test["test_data"])
+            w("\n")
+
+
+@cache
+def _clipboard_command() -> Optional[tuple[str, ...]]:
+    """Return the first available clipboard command, probing PATH only once."""
+    for cmd in _CLIPBOARD_COMMANDS:
+        if shutil.which(cmd[0]):
+            return cmd
+    return None
+
+
+def _copy_to_clipboard(console: "Console", text: str) -> None:
+    """Copy text to clipboard using pbcopy, wl-copy, xclip or xsel."""
     import subprocess
 
+    cmd = _clipboard_command()
+    if cmd is None:
+        console.print(
+            "[yellow]⚠ Clipboard copy failed (pbcopy/wl-copy/xclip/xsel not available)[/yellow]"
+        )
+        return
+
     try:
-        if platform.system() == "Darwin":
-            # macOS
-            subprocess.run(["pbcopy"], input=text.encode(), check=True)
-        else:
-            # Linux
-            subprocess.run(["xclip", "-selection", "clipboard"], input=text.encode(), check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        console.print("[yellow]⚠ Clipboard copy failed (pbcopy/xclip not available)[/yellow]")
+        # Let subprocess encode straight into the pipe instead of building
+        # a separate bytes copy of the plan first.
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, text=True, encoding="utf-8")
+        proc.communicate(text)
+        failed = proc.returncode != 0
+    except OSError:
+        failed = True
+    if failed:
+        console.print(f"[yellow]⚠ Clipboard copy failed ({cmd[0]} returned an error)[/yellow]")
@@ -3,14 +3,10 @@
 import asyncio
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
 from ..cli_config import config_manager
 from ...app.token_service import TokenHealthService
 
-console = Console()
-
 
 def health():
     """
@@ -25,6 +21,11 @@ def health():
     Example:
         testplan health
     """
+    from rich.console import Console
+    from rich.table import Table
+
+    console = Console()
+
     # Check if configuration exists
     if not config_manager.is_configured():
         console.print("[red]✗ Configuration incomplete![/red]")
@@ -37,15 +38,7 @@ def health():
     config = config_manager.load()
 
     # Set environment variables for token service
-    import os
-
-    os.environ["JIRA_URL"] = config.jira_url or ""
-    os.environ["JIRA_USERNAME"] = config.jira_email or ""
-    os.environ["JIRA_API_TOKEN"] = config.jira_token or ""
-    os.environ["ANTHROPIC_API_KEY"] = config.anthropic_key or ""
-    os.environ["GITHUB_TOKEN"] = config.github_token or ""
-    os.environ["FIGMA_TOKEN"] = config.figma_token or ""
-    os.environ["LLM_PROVIDER"] = "claude"
+    config_manager.export_to_env(config)
 
     # Create token service and validate
     with console.status("[bold blue]Checking API tokens...", spinner="dots"):
@@ -1,17 +1,14 @@
 """Setup wizard command for interactive configuration."""
 
 import asyncio
+import getpass
 from pathlib import Path
+from typing import Optional
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Confirm, Prompt
 
 from ..cli_config import config_manager
 
-console = Console()
-
 
 def setup():
     """
@@ -26,6 +23,12 @@ def setup():
     Example:
         testplan setup
     """
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.prompt import Confirm, Prompt
+
+    console = Console()
+
     console.print()
     console.print(
         Panel.fit(
@@ -66,11 +69,7 @@ def setup():
         default=config.jira_email or "",
     )
 
-    jira_token = Prompt.ask(
-        "Jira API Token",
-        password=True,
-        default=config.jira_token or "",
-    )
+    jira_token = _ask_secret("Jira API Token", config.jira_token)
 
     config.jira_url = jira_url
     config.jira_email = jira_email
@@ -82,11 +81,7 @@ def setup():
     console.print("[bold cyan]2. Claude API Configuration[/bold cyan] (Required)")
     console.print("[dim]Get your API key from: https://console.anthropic.com/settings/keys[/dim]\n")
 
-    anthropic_key = Prompt.ask(
-        "Anthropic API Key",
-        password=True,
-        default=config.anthropic_key or "",
-    )
+    anthropic_key = _ask_secret("Anthropic API Key", config.anthropic_key)
 
     config.anthropic_key = anthropic_key
     console.print("[green]✓[/green] Claude API key configured\n")
@@ -97,11 +92,7 @@ def setup():
     console.print("[dim]Get token from: https://github.com/settings/tokens[/dim]\n")
 
     if Confirm.ask("Configure GitHub token?", default=bool(config.github_token)):
-        github_token = Prompt.ask(
-            "GitHub Personal Access Token",
-            password=True,
-            default=config.github_token or "",
-        )
+        github_token = _ask_secret("GitHub Personal Access Token", config.github_token)
         if github_token:
             config.github_token = github_token
             console.print("[green]✓[/green] GitHub token configured\n")
@@ -116,11 +107,7 @@ def setup():
     console.print("[dim]Get token from: https://www.figma.com/developers/api#access-tokens[/dim]\n")
 
     if Confirm.ask("Configure Figma token?", default=bool(config.figma_token)):
-        figma_token = Prompt.ask(
-            "Figma Personal Access Token",
-            password=True,
-            default=config.figma_token or "",
-        )
+        figma_token = _ask_secret("Figma Personal Access Token", config.figma_token)
         if figma_token:
             config.figma_token = figma_token
             console.print("[green]✓[/green] Figma token configured\n")
@@ -138,15 +125,7 @@ def setup():
     console.print("[bold blue]Testing API tokens...[/bold blue]")
 
     # Set environment variables for health check
-    import os
-
-    os.environ["JIRA_URL"] = config.jira_url or ""
-    os.environ["JIRA_USERNAME"] = config.jira_email or ""
-    os.environ["JIRA_API_TOKEN"] = config.jira_token or ""
-    os.environ["ANTHROPIC_API_KEY"] = config.anthropic_key or ""
-    os.environ["GITHUB_TOKEN"] = config.github_token or ""
-    os.environ["FIGMA_TOKEN"] = config.figma_token or ""
-    os.environ["LLM_PROVIDER"] = "claude"
+    config_manager.export_to_env(config)
 
     # Run health check
     from ...app.token_service import TokenHealthService
@@ -191,3 +170,9 @@ def setup():
             )
         )
         raise typer.Exit(1)
+
+
+def _ask_secret(label: str, current: Optional[str]) -> str:
+    """Prompt for a token without echoing it; blank input keeps the current value."""
+    suffix = " (leave blank to keep current)" if current else ""
+    return getpass.getpass(f"{label}{suffix}: ") or current or ""
@@ -1,28 +1,66 @@
 """Main CLI entry point for testplan command."""
 
+from typing import Annotated
+
 import typer
-from rich.console import Console
-from typing_extensions import Annotated
+from typer.core import TyperGroup
+
+# Subcommand name -> (public name in the commands package, help override).
+# Command modules are only imported when their subcommand is resolved, so
+# `testplan --version` and `testplan config ...` don't pay for the Jira/LLM
+# clients that `generate` needs.
+_LAZY_COMMANDS = {
+    "setup": ("setup", None),
+    "health": ("health", None),
+    "fetch": ("fetch", None),
+    "generate": ("generate", None),
+    "config": ("config_app", "Manage configuration"),
+}
+
+
+class LazyCommandGroup(TyperGroup):
+    """Typer group that imports subcommand modules on demand."""
+
+    def list_commands(self, ctx) -> list[str]:
+        return list(_LAZY_COMMANDS)
+
+    def get_command(self, ctx, cmd_name: str):
+        if cmd_name not in _LAZY_COMMANDS:
+            return super().get_command(ctx, cmd_name)
+
+        from . import commands
+
+        attr, help_text = _LAZY_COMMANDS[cmd_name]
+        target = getattr(commands, attr)
+        if not isinstance(target, typer.Typer):
+            single = typer.Typer(add_completion=False)
+            single.command(name=cmd_name)(target)
+            target = single
+
+        command = typer.main.get_command(target)
+        command.name = cmd_name
+        if help_text:
+            command.help = help_text
+        return command
 
-from . import commands
 
 # Create the main Typer app
 app = typer.Typer(
     name="testplan",
+    cls=LazyCommandGroup,
     help="Generate structured QA test plans from Jira tickets using AI",
     no_args_is_help=True,
     add_completion=False,
 )
 
-# Global console for rich output
-console = Console()
-
 
 # Add version callback
 def version_callback(value: bool):
     """Show version and exit."""
     if value:
-        console.print("[bold blue]testplan[/bold blue] version [green]0.1.0[/green]")
+        from rich.console import Console
+
+        Console().print("[bold blue]testplan[/bold blue] version [green]0.1.0[/green]")
         raise typer.Exit()
 
 
@@ -48,13 +86,5 @@ def main(
     pass
 
 
-# Register command groups
-app.add_typer(commands.config_app, name="config", help="Manage configuration")
-app.command(name="setup")(commands.setup)
-app.command(name="health")(commands.health)
-app.command(name="fetch")(commands.fetch)
-app.command(name="generate")(commands.generate)
-
-
 if __name__ == "__main__":
     app()
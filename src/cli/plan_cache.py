@@ -0,0 +1,109 @@
+"""Local cache of generated test plans for the CLI."""
+
+import hashlib
+import json
+import os
+import time
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Optional
+
+# Plans older than this are regenerated. The key can't see context the LLM
+# client fetches on its own (linked Confluence pages, GitHub repo docs), so
+# entries must not live forever.
+MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+
+# Most plans kept on disk; the oldest are pruned on write beyond this.
+MAX_ENTRIES = 200
+
+# Part of every cache key. Bump it whenever the LLM prompts or the TestPlan
+# fields the formatters read change, so plans made by older code are ignored.
+PLAN_CACHE_VERSION = 1
+
+
+class PlanCache:
+    """
+    Caches generated test plans in memory and under ~/.cache/jira-testplan/plans.
+
+    Entries are keyed on a hash of the inputs the CLI sends to the LLM
+    (ticket content, development info, comments, parent/linked issues,
+    bounce history, attachment URLs and model) plus PLAN_CACHE_VERSION, so
+    any change to the ticket, or to the prompts/plan format, produces a new
+    key and a fresh generation. Context the LLM client fetches itself
+    (Confluence pages, GitHub repo docs) is not in the key; entries expire
+    after MAX_AGE_SECONDS so such changes are picked up eventually.
+    """
+
+    def __init__(self):
+        """Initialize an empty in-memory layer; the disk location is resolved lazily."""
+        self._memory: dict[str, dict] = {}
+
+    @cached_property
+    def cache_dir(self) -> Path:
+        """Cache directory, honouring XDG_CACHE_HOME."""
+        base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+        return Path(base) / "jira-testplan" / "plans"
+
+    @staticmethod
+    def make_key(**inputs: Any) -> str:
+        """Build a stable cache key from the LLM inputs and PLAN_CACHE_VERSION."""
+        payload = json.dumps(
+            {"cache_version": PLAN_CACHE_VERSION, **inputs}, sort_keys=True, default=str
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the cached test plan dict for key, or None on a miss or expired entry."""
+        if key in self._memory:
+            return self._memory[key]
+
+        path = self.cache_dir / f"{key}.json"
+        try:
+            if time.time() - path.stat().st_mtime > MAX_AGE_SECONDS:
+                path.unlink(missing_ok=True)
+                return None
+            test_plan = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        self._memory[key] = test_plan
+        return test_plan
+
+    def put(self, key: str, test_plan: dict) -> None:
+        """Store a test plan dict and prune old entries. Disk failures are ignored."""
+        self._memory[key] = test_plan
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            (self.cache_dir / f"{key}.json").write_text(
+                json.dumps(test_plan), encoding="utf-8"
+            )
+            self._prune()
+        except OSError:
+            pass
+
+    def _prune(self) -> None:
+        """Delete expired entries, then the oldest ones beyond MAX_ENTRIES."""
+        entries = []
+        cutoff = time.time() - MAX_AGE_SECONDS
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                mtime = path.stat().st_mtime
+                if mtime < cutoff:
+                    path.unlink(missing_ok=True)
+                else:
+                    entries.append((mtime, path))
+            except OSError:
+                continue
+
+        if len(entries) <= MAX_ENTRIES:
+            return
+        entries.sort()
+        for _, path in entries[: len(entries) - MAX_ENTRIES]:
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                continue
+
+
+# Global plan cache instance
+plan_cache = PlanCache()
@@ -5,125 +5,253 @@ to Claude desktop app and other MCP-compatible clients.
 """
 
 import asyncio
+import inspect
+import io
 import json
 import os
+import time
+from collections import Counter, OrderedDict, defaultdict
 from dataclasses import asdict
+from functools import cache
+from itertools import islice
 from typing import Any
 
 from mcp.server import Server
+from mcp.server.session import ServerSession
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
 from ..app.jira_client import JiraClient, JiraAuthError, JiraNotFoundError
 from ..app.llm_client import get_llm_client, LLMError
-from ..app.token_service import TokenHealthService
+from ..app.models import JiraIssue, TestPlan
+from ..app.token_service import TokenHealthService, TokenStatus
 
 # Initialize MCP server
 app = Server("jira-testplan-bot")
 
-
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available tools."""
-    return [
-        Tool(
-            name="fetch_jira_ticket",
-            description=(
-                "Fetch a Jira ticket with its details, description, and development activity "
-                "(commits, pull requests, branches). Returns ticket summary, description, labels, "
-                "issue type, and all linked development information."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "ticket_key": {
-                        "type": "string",
-                        "description": "Jira ticket key (e.g., PROJ-123, ABC-456)",
-                    }
-                },
-                "required": ["ticket_key"],
+# Fetched tickets are reused for a short while, since fetch_jira_ticket is
+# usually followed by generate_test_plan for the same key.
+_ISSUE_CACHE_TTL_SECONDS = 60.0
+_ISSUE_CACHE_MAX_ENTRIES = 32
+_issue_cache: OrderedDict[str, tuple[float, JiraIssue]] = OrderedDict()
+_issue_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+# Calls currently holding or waiting on each key's lock
+_issue_lock_users: Counter[str] = Counter()
+
+# Set once _validate_environment() has passed for this process
+_env_validated = False
+
+# Environment variables _validate_environment() requires, with descriptions
+_REQUIRED_VARS: tuple[tuple[str, str], ...] = (
+    ("JIRA_URL", "Jira base URL (e.g., https://company.atlassian.net)"),
+    ("JIRA_USERNAME", "Jira account email"),
+    ("JIRA_API_TOKEN", "Jira API token"),
+    ("ANTHROPIC_API_KEY", "Anthropic/Claude API key"),
+)
+
+# How many tickets fetch_jira_tickets requests from Jira at once
+_BATCH_FETCH_CONCURRENCY = 8
+
+# Progress steps reported by generate_test_plan: fetched, generating, formatting
+_GENERATE_STEPS = 3
+
+# Progress notifications only carry a status message on mcp releases whose
+# send_progress_notification accepts it; older ones take progress/total only.
+_PROGRESS_HAS_MESSAGE = (
+    "message" in inspect.signature(ServerSession.send_progress_notification).parameters
+)
+
+# Shared stand-in for a missing or null list field
+_EMPTY: tuple = ()
+
+_MANUAL_VERIFICATION_NOTE = (
+    "\n> ⚠️ **Needs manual verification** — the AC element referenced here "
+    "could not be verified in the PR diff or testID reference.\n"
+)
+
+
+@cache
+def _get_jira_client() -> JiraClient:
+    """
+    Return the process-wide JiraClient, created on first use.
+
+    Tool calls share one client so they also share its rate-limit pacing;
+    it's built lazily because credentials arrive via the environment the
+    MCP host passes in, which is only checked once a tool is called.
+    """
+    return JiraClient()
+
+
+async def _get_issue(ticket_key: str) -> JiraIssue:
+    """
+    Fetch a ticket, reusing a copy fetched in the last minute.
+
+    Concurrent calls for the same key wait on one fetch instead of each
+    hitting Jira. The cache is LRU-bounded; errors are never cached.
+    """
+    lock = _issue_locks[ticket_key]
+    _issue_lock_users[ticket_key] += 1
+    try:
+        async with lock:
+            cached = _issue_cache.get(ticket_key)
+            if cached and time.monotonic() - cached[0] < _ISSUE_CACHE_TTL_SECONDS:
+                _issue_cache.move_to_end(ticket_key)
+                return cached[1]
+
+            issue = await _get_jira_client().get_issue(ticket_key)
+            _issue_cache[ticket_key] = (time.monotonic(), issue)
+            _issue_cache.move_to_end(ticket_key)
+            while len(_issue_cache) > _ISSUE_CACHE_MAX_ENTRIES:
+                evicted_key, _ = _issue_cache.popitem(last=False)
+                # A lock still in use is dropped by its last user instead
+                if evicted_key not in _issue_lock_users:
+                    _issue_locks.pop(evicted_key, None)
+            return issue
+    finally:
+        # The last caller out drops the lock for keys that never made it
+        # into the cache (failed or cancelled fetches). Waiters count as
+        # users, so nobody is left queued on a lock a new caller can't see.
+        _issue_lock_users[ticket_key] -= 1
+        if not _issue_lock_users[ticket_key]:
+            del _issue_lock_users[ticket_key]
+            if ticket_key not in _issue_cache:
+                _issue_locks.pop(ticket_key, None)
+
+
+# Tool definitions are static, so they're built once at import and the same
+# list is handed back on every list_tools request (the SDK doesn't mutate it).
+_TOOLS: list[Tool] = [
+    Tool(
+        name="fetch_jira_ticket",
+        description=(
+            "Fetch a Jira ticket with its details, description, and development activity "
+            "(commits, pull requests, branches). Returns ticket summary, description, labels, "
+            "issue type, and all linked development information."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "ticket_key": {
+                    "type": "string",
+                    "description": "Jira ticket key (e.g., PROJ-123, ABC-456)",
+                }
             },
+            "required": ["ticket_key"],
+        },
+    ),
+    Tool(
+        name="fetch_jira_tickets",
+        description=(
+            "Fetch several Jira tickets at once, concurrently. Returns the same details as "
+            "fetch_jira_ticket for each ticket, separated by horizontal rules. Tickets that "
+            "can't be fetched are reported inline without failing the rest."
         ),
-        Tool(
-            name="generate_test_plan",
-            description=(
-                "CRITICAL DISPLAY RULE: You MUST output the ENTIRE tool result verbatim. "
-                "Do NOT summarize, shorten, collapse, or paraphrase any part of it. "
-                "Copy every single line exactly as returned. No exceptions.\n\n"
-                "Generate a comprehensive test plan for a Jira ticket. "
-                "Automatically fetches ticket details, development activity (commits, PRs, code changes), "
-                "and uses AI to create structured test cases with happy path, edge cases, "
-                "and regression checklist. Returns test plan in markdown format.\n\n"
-                "The result includes a pre-formatted Jira comment block between "
-                "'--- JIRA COMMENT START ---' and '--- JIRA COMMENT END ---' markers. "
-                "When posting to Jira, extract and pass ONLY that block verbatim."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "ticket_key": {
-                        "type": "string",
-                        "description": "Jira ticket key (e.g., PROJ-123, ABC-456)",
-                    }
-                },
-                "required": ["ticket_key"],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "ticket_keys": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "minItems": 1,
+                    "description": "Jira ticket keys (e.g., [\"PROJ-123\", \"PROJ-124\"])",
+                }
             },
+            "required": ["ticket_keys"],
+        },
+    ),
+    Tool(
+        name="generate_test_plan",
+        description=(
+            "CRITICAL DISPLAY RULE: You MUST output the ENTIRE tool result verbatim. "
+            "Do NOT summarize, shorten, collapse, or paraphrase any part of it. "
+            "Copy every single line exactly as returned. No exceptions.\n\n"
+            "Generate a comprehensive test plan for a Jira ticket. "
+            "Automatically fetches ticket details, development activity (commits, PRs, code changes), "
+            "and uses AI to create structured test cases with happy path, edge cases, "
+            "and regression checklist. Returns test plan in markdown format.\n\n"
+            "The result includes a pre-formatted Jira comment block between "
+            "'--- JIRA COMMENT START ---' and '--- JIRA COMMENT END ---' markers. "
+            "When posting to Jira, extract and pass ONLY that block verbatim."
         ),
-        Tool(
-            name="post_test_plan_to_jira",
-            description=(
-                "Post a test plan as a comment to a Jira ticket. "
-                "If a test plan comment already exists on the ticket (from a previous run), "
-                "it will be updated instead of creating a duplicate. "
-                "Use this after generate_test_plan to save the plan directly to the Jira ticket.\n\n"
-                "CRITICAL: The test_plan parameter must contain ONLY the exact text found between "
-                "the '--- JIRA COMMENT START ---' and '--- JIRA COMMENT END ---' markers in the "
-                "generate_test_plan output. Do NOT add any title, ticket name, header, preamble, "
-                "or commentary. Extract and pass that block verbatim."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "ticket_key": {
-                        "type": "string",
-                        "description": "Jira ticket key (e.g., PROJ-123, ABC-456)",
-                    },
-                    "test_plan": {
-                        "type": "string",
-                        "description": (
-                            "The exact text between '--- JIRA COMMENT START ---' and "
-                            "'--- JIRA COMMENT END ---' from generate_test_plan output. "
-                            "No headers, no preamble, no extra text."
-                        ),
-                    },
-                },
-                "required": ["ticket_key", "test_plan"],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "ticket_key": {
+                    "type": "string",
+                    "description": "Jira ticket key (e.g., PROJ-123, ABC-456)",
+                }
             },
+            "required": ["ticket_key"],
+        },
+    ),
+    Tool(
+        name="post_test_plan_to_jira",
+        description=(
+            "Post a test plan as a comment to a Jira ticket. "
+            "If a test plan comment already exists on the ticket (from a previous run), "
+            "it will be updated instead of creating a duplicate. "
+            "Use this after generate_test_plan to save the plan directly to the Jira ticket.\n\n"
+            "CRITICAL: The test_plan parameter must contain ONLY the exact text found between "
+            "the '--- JIRA COMMENT START ---' and '--- JIRA COMMENT END ---' markers in the "
+            "generate_test_plan output. Do NOT add any title, ticket name, header, preamble, "
+            "or commentary. Extract and pass that block verbatim."
         ),
-        Tool(
-            name="check_token_health",
-            description=(
-                "Check the health status of all configured API tokens "
-                "(Jira, Claude/Anthropic, GitHub, Figma). "
-                "Returns validation status, error messages, and help URLs for each service."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {},
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "ticket_key": {
+                    "type": "string",
+                    "description": "Jira ticket key (e.g., PROJ-123, ABC-456)",
+                },
+                "test_plan": {
+                    "type": "string",
+                    "description": (
+                        "The exact text between '--- JIRA COMMENT START ---' and "
+                        "'--- JIRA COMMENT END ---' from generate_test_plan output. "
+                        "No headers, no preamble, no extra text."
+                    ),
+                },
             },
+            "required": ["ticket_key", "test_plan"],
+        },
+    ),
+    Tool(
+        name="check_token_health",
+        description=(
+            "Check the health status of all configured API tokens "
+            "(Jira, Claude/Anthropic, GitHub, Figma). "
+            "Returns validation status, error messages, and help URLs for each service."
         ),
-    ]
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+]
+
+
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available tools."""
+    return _TOOLS
 
 
 @app.call_tool()
 async def call_tool(name: str, arguments: Any) -> list[TextContent]:
     """Handle tool calls."""
 
-    # Validate environment configuration
-    _validate_environment()
+    # Validate environment configuration. The environment is process-scoped,
+    # so once it has passed there's nothing to re-check; a failure isn't
+    # remembered, so it keeps being reported until the host fixes it.
+    global _env_validated
+    if not _env_validated:
+        _validate_environment()
+        _env_validated = True
 
     if name == "fetch_jira_ticket":
         return await _fetch_jira_ticket(arguments["ticket_key"])
+    elif name == "fetch_jira_tickets":
+        return await _fetch_jira_tickets(arguments["ticket_keys"])
     elif name == "generate_test_plan":
         return await _generate_test_plan(arguments["ticket_key"])
     elif name == "post_test_plan_to_jira":
@@ -134,51 +262,76 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
         raise ValueError(f"Unknown tool: {name}")
 
 
+async def _report_progress(progress: int, total: int, message: str) -> None:
+    """
+    Send an MCP progress notification for the current tool call.
+
+    Tool results are delivered in one response, so this is how a client sees
+    that a long call (mostly the LLM request) is moving. It's a no-op if the
+    client didn't pass a progress token or we're outside a request.
+    """
+    try:
+        ctx = app.request_context
+    except LookupError:
+        return
+    progress_token = ctx.meta.progressToken if ctx.meta else None
+    if progress_token is None:
+        return
+    if _PROGRESS_HAS_MESSAGE:
+        await ctx.session.send_progress_notification(
+            progress_token, progress, total=total, message=message
+        )
+    else:
+        await ctx.session.send_progress_notification(progress_token, progress, total=total)
+
+
+def _format_ticket(issue: JiraIssue) -> str:
+    """Render a fetched ticket and its development activity as markdown."""
+    # Each fragment starts with the newline that ends the previous line, so
+    # everything goes into one buffer.
+    buf = io.StringIO()
+    w = buf.write
+    w(f"# {issue.key}: {issue.summary}\n")
+    w(f"\n**Type:** {issue.issue_type}")
+    w(f"\n**Labels:** {', '.join(issue.labels) if issue.labels else 'None'}\n")
+    w("\n## Description\n")
+    w(issue.description or "*No description provided*")
+    w("\n")
+
+    # Add development info if available
+    if issue.development_info:
+        dev_info = issue.development_info
+
+        if dev_info.pull_requests:
+            w("\n## Pull Requests")
+            for pr in dev_info.pull_requests:
+                w(f"\n- **{pr.title}** ({pr.status})")
+                w(f"\n  - Branch: {pr.source_branch} → {pr.destination_branch}")
+                w(f"\n  - URL: {pr.url}")
+            w("\n")
+
+        if dev_info.commits:
+            w(f"\n## Commits ({len(dev_info.commits)} total)")
+            # Show first 5
+            w("".join(f"\n- {commit.message}" for commit in islice(dev_info.commits, 5)))
+            if len(dev_info.commits) > 5:
+                w(f"\n  *...and {len(dev_info.commits) - 5} more*")
+            w("\n")
+
+        if dev_info.branches:
+            w("\n## Branches")
+            for branch in dev_info.branches:
+                w(f"\n- {branch}")
+            w("\n")
+
+    return buf.getvalue()
+
+
 async def _fetch_jira_ticket(ticket_key: str) -> list[TextContent]:
     """Fetch Jira ticket details."""
     try:
-        jira_client = JiraClient()
-        issue = await jira_client.get_issue(ticket_key)
-
-        # Format the response
-        output = [
-            f"# {issue.key}: {issue.summary}",
-            "",
-            f"**Type:** {issue.issue_type}",
-            f"**Labels:** {', '.join(issue.labels) if issue.labels else 'None'}",
-            "",
-            "## Description",
-            issue.description or "*No description provided*",
-            "",
-        ]
-
-        # Add development info if available
-        if issue.development_info:
-            dev_info = issue.development_info
-
-            if dev_info.pull_requests:
-                output.append("## Pull Requests")
-                for pr in dev_info.pull_requests:
-                    output.append(f"- **{pr.title}** ({pr.status})")
-                    output.append(f"  - Branch: {pr.source_branch} → {pr.destination_branch}")
-                    output.append(f"  - URL: {pr.url}")
-                output.append("")
-
-            if dev_info.commits:
-                output.append(f"## Commits ({len(dev_info.commits)} total)")
-                for commit in dev_info.commits[:5]:  # Show first 5
-                    output.append(f"- {commit.message}")
-                if len(dev_info.commits) > 5:
-                    output.append(f"  *...and {len(dev_info.commits) - 5} more*")
-                output.append("")
-
-            if dev_info.branches:
-                output.append("## Branches")
-                for branch in dev_info.branches:
-                    output.append(f"- {branch}")
-                output.append("")
-
-        return [TextContent(type="text", text="\n".join(output))]
+        issue = await _get_issue(ticket_key)
+        return [TextContent(type="text", text=_format_ticket(issue))]
 
     except JiraNotFoundError:
         return [TextContent(
@@ -197,13 +350,55 @@ async def _fetch_jira_ticket(ticket_key: str) -> list[TextContent]:
         )]
 
 
-def _format_test_plan_for_jira(test_plan_dict: dict) -> str:
+async def _fetch_jira_tickets(ticket_keys: list[str]) -> list[TextContent]:
+    """Fetch several Jira tickets concurrently and return them as one document."""
+    # Duplicate keys are fetched and shown once, in first-seen order
+    ticket_keys = list(dict.fromkeys(ticket_keys))
+    semaphore = asyncio.Semaphore(_BATCH_FETCH_CONCURRENCY)
+
+    async def fetch_one(ticket_key: str) -> JiraIssue | Exception:
+        async with semaphore:
+            try:
+                return await _get_issue(ticket_key)
+            except JiraAuthError:
+                # Same credentials for every ticket: fail the whole group so
+                # the other in-flight fetches are cancelled
+                raise
+            except Exception as e:
+                return e
+
+    auth_error = None
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(fetch_one(ticket_key)) for ticket_key in ticket_keys]
+    except* JiraAuthError as eg:
+        auth_error = eg.exceptions[0]
+    if auth_error:
+        return [TextContent(
+            type="text",
+            text=f"❌ Jira authentication failed: {auth_error}\n\nCheck your JIRA_API_TOKEN environment variable."
+        )]
+
+    sections = []
+    for ticket_key, task in zip(ticket_keys, tasks):
+        result = task.result()
+        if isinstance(result, JiraNotFoundError):
+            sections.append(f"# {ticket_key}\n\n❌ Ticket not found: {ticket_key}\n")
+        elif isinstance(result, Exception):
+            sections.append(f"# {ticket_key}\n\n❌ Error fetching ticket: {result}\n")
+        else:
+            sections.append(_format_ticket(result))
+
+    return [TextContent(type="text", text="\n---\n\n".join(sections))]
+
+
+def _format_test_plan_for_jira(test_plan: TestPlan) -> str:
     """Format test plan identically to the UI's formatTestPlanAsJira() function."""
     jira = ""
 
-    if test_plan_dict.get("happy_path"):
+    if test_plan.happy_path:
         jira += "✅ HAPPY PATH TEST CASES\n\n"
-        for index, test in enumerate(test_plan_dict["happy_path"]):
+        for index, test in enumerate(test_plan.happy_path):
             title = f"**{index + 1}. {test['title']}"
             if test.get("priority"):
                 priority = test["priority"]
@@ -224,9 +419,9 @@ def _format_test_plan_for_jira(test_plan_dict: dict) -> str:
                 jira += f"Test Data: {test['test_data']}\n\n"
             jira += "────────────────────────────────────────────\n\n"
 
-    if test_plan_dict.get("edge_cases"):
+    if test_plan.edge_cases:
         jira += "🔍 EDGE CASES & ERROR SCENARIOS\n\n"
-        for index, test in enumerate(test_plan_dict["edge_cases"]):
+        for index, test in enumerate(test_plan.edge_cases):
             title = f"**{index + 1}. {test['title']}"
             if test.get("priority"):
                 priority = test["priority"]
@@ -249,9 +444,9 @@ def _format_test_plan_for_jira(test_plan_dict: dict) -> str:
                 jira += f"Test Data: {test['test_data']}\n\n"
             jira += "────────────────────────────────────────────\n\n"
 
-    if test_plan_dict.get("integration_tests"):
+    if test_plan.integration_tests:
         jira += "🔗 INTEGRATION & BACKEND TESTS\n\n"
-        for index, test in enumerate(test_plan_dict["integration_tests"]):
+        for index, test in enumerate(test_plan.integration_tests):
             title = f"**{index + 1}. {test['title']}"
             if test.get("priority"):
                 priority = test["priority"]
@@ -272,26 +467,51 @@ def _format_test_plan_for_jira(test_plan_dict: dict) -> str:
                 jira += f"Test Data: {test['test_data']}\n\n"
             jira += "────────────────────────────────────────────\n\n"
 
-    if test_plan_dict.get("regression_checklist"):
+    if test_plan.regression_checklist:
         jira += "🔄 REGRESSION CHECKLIST\n\n"
-        for item in test_plan_dict["regression_checklist"]:
+        for item in test_plan.regression_checklist:
             jira += f"  • {item}\n"
         jira += "\n"
 
     return jira
 
 
+def _format_test_case(number: int, test: dict) -> str:
+    """Render one test case for the markdown display, newline-first."""
+    steps = "".join(
+        f"\n{step_num}. {step}" for step_num, step in enumerate(test.get("steps") or _EMPTY, 1)
+    )
+    note = _MANUAL_VERIFICATION_NOTE if test.get("needs_manual_verification") else ""
+    return (
+        f"\n### Test {number}: {test['title']}\n{note}"
+        f"\n**Steps:**{steps}"
+        f"\n\n**Expected Result:**\n{test.get('expected', '')}\n"
+    )
+
+
+def _format_test_section(heading: str, tests: list[dict]) -> str:
+    """Render a markdown section of test cases (happy path or edge cases)."""
+    return f"\n## {heading}\n" + "".join(
+        _format_test_case(number, test) for number, test in enumerate(tests, 1)
+    )
+
+
 async def _generate_test_plan(ticket_key: str) -> list[TextContent]:
     """Generate test plan for a Jira ticket."""
     try:
+        # Build the LLM client first: it's cheap and local, and a missing API
+        # key then fails before we spend a Jira round-trip.
+        llm_client = get_llm_client()
+
         # Fetch ticket
-        jira_client = JiraClient()
-        issue = await jira_client.get_issue(ticket_key)
+        jira_client = _get_jira_client()
+        issue = await _get_issue(ticket_key)
+        await _report_progress(1, _GENERATE_STEPS, f"Fetched {issue.key}")
 
         # Prepare development info
         development_info = None
         if issue.development_info:
-            development_info = asdict(issue.development_info)
+            development_info = issue.development_info.as_dict
 
         # Prepare Jira comments
         comments = None
@@ -313,19 +533,19 @@ async def _generate_test_plan(ticket_key: str) -> list[TextContent]:
         if issue.bounce_history:
             bounce_history = [asdict(b) for b in issue.bounce_history]
 
-        # Download image attachments (cap at 3, matching CLI behavior)
+        # Download image attachments (cap at 3, matching CLI behavior). The
+        # downloads are independent, so fetch them concurrently.
         images = None
         if issue.attachments:
-            images = []
-            for attachment in issue.attachments[:3]:
-                image_data = await jira_client.download_image_as_base64(attachment.url)
-                if image_data:
-                    images.append(image_data)
-            if not images:
-                images = None
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(jira_client.download_image_as_base64(attachment.url))
+                    for attachment in issue.attachments[:3]
+                ]
+            images = [task.result() for task in tasks if task.result()] or None
 
         # Generate test plan
-        llm_client = get_llm_client()
+        await _report_progress(2, _GENERATE_STEPS, "Generating test plan with Claude")
         test_plan = await llm_client.generate_test_plan(
             ticket_key=issue.key,
             summary=issue.summary,
@@ -339,75 +559,39 @@ async def _generate_test_plan(ticket_key: str) -> list[TextContent]:
             bounce_history=bounce_history,
         )
 
-        # Convert to dict for formatting
-        test_plan_dict = asdict(test_plan)
+        await _report_progress(3, _GENERATE_STEPS, "Formatting test plan")
 
-        # Build Jira-formatted block (same as UI's formatTestPlanAsJira)
-        jira_text = _format_test_plan_for_jira(test_plan_dict)
+        # Build Jira-formatted block (same as UI's formatTestPlanAsJira). Both
+        # formatters read the TestPlan's fields directly, so the plan is never
+        # deep-copied through asdict().
+        jira_text = _format_test_plan_for_jira(test_plan)
 
-        # Build markdown display for Claude Desktop
-        output = [
-            "📋 **COMPLETE TEST PLAN** - Display this entire document without summarizing",
-            "",
-        ]
+        # Build markdown display for Claude Desktop, using the same
+        # newline-first fragments as above.
+        buf = io.StringIO()
+        w = buf.write
+        w("📋 **COMPLETE TEST PLAN** - Display this entire document without summarizing\n")
 
         # Happy Path
-        if test_plan_dict.get("happy_path"):
-            output.append("## Happy Path Test Cases")
-            output.append("")
-            for i, test in enumerate(test_plan_dict["happy_path"], 1):
-                output.append(f"### Test {i}: {test['title']}")
-                output.append("")
-                if test.get("needs_manual_verification"):
-                    output.append(
-                        "> ⚠️ **Needs manual verification** — the AC element referenced here could not be verified in the PR diff or testID reference."
-                    )
-                    output.append("")
-                output.append("**Steps:**")
-                for step_num, step in enumerate(test.get("steps", []), 1):
-                    output.append(f"{step_num}. {step}")
-                output.append("")
-                output.append("**Expected Result:**")
-                output.append(test.get("expected", ""))
-                output.append("")
+        if test_plan.happy_path:
+            w(_format_test_section("Happy Path Test Cases", test_plan.happy_path))
 
         # Edge Cases
-        if test_plan_dict.get("edge_cases"):
-            output.append("## Edge Cases")
-            output.append("")
-            for i, test in enumerate(test_plan_dict["edge_cases"], 1):
-                output.append(f"### Test {i}: {test['title']}")
-                output.append("")
-                if test.get("needs_manual_verification"):
-                    output.append(
-                        "> ⚠️ **Needs manual verification** — the AC element referenced here could not be verified in the PR diff or testID reference."
-                    )
-                    output.append("")
-                output.append("**Steps:**")
-                for step_num, step in enumerate(test.get("steps", []), 1):
-                    output.append(f"{step_num}. {step}")
-                output.append("")
-                output.append("**Expected Result:**")
-                output.append(test.get("expected", ""))
-                output.append("")
+        if test_plan.edge_cases:
+            w(_format_test_section("Edge Cases", test_plan.edge_cases))
 
         # Regression Checklist
-        if test_plan_dict.get("regression_checklist"):
-            output.append("## Regression Checklist")
-            output.append("")
-            for item in test_plan_dict["regression_checklist"]:
-                output.append(f"- {item}")
-            output.append("")
-
-        output.append("---")
-        output.append("")
-        output.append("*Generated with Claude Opus 4.5*")
-        output.append("")
-        output.append("--- JIRA COMMENT START ---")
-        output.append(jira_text.rstrip())
-        output.append("--- JIRA COMMENT END ---")
-
-        return [TextContent(type="text", text="\n".join(output))]
+        if test_plan.regression_checklist:
+            w("\n## Regression Checklist\n")
+            for item in test_plan.regression_checklist:
+                w(f"\n- {item}")
+            w("\n")
+
+        w("\n---\n\n*Generated with Claude Opus 4.5*\n\n--- JIRA COMMENT START ---\n")
+        w(jira_text.rstrip())
+        w("\n--- JIRA COMMENT END ---")
+
+        return [TextContent(type="text", text=buf.getvalue())]
 
     except JiraNotFoundError:
         return [TextContent(
@@ -434,8 +618,10 @@ async def _generate_test_plan(ticket_key: str) -> list[TextContent]:
 async def _post_test_plan_to_jira(ticket_key: str, test_plan: str) -> list[TextContent]:
     """Post a test plan as a comment to a Jira ticket."""
     try:
-        jira_client = JiraClient()
+        jira_client = _get_jira_client()
         result = await jira_client.post_comment(ticket_key, test_plan)
+        # The ticket's comments changed, and they feed the next generation
+        _issue_cache.pop(ticket_key, None)
 
         if result.get("updated"):
             return [TextContent(
@@ -465,38 +651,45 @@ async def _post_test_plan_to_jira(ticket_key: str, test_plan: str) -> list[TextC
         )]
 
 
+def _format_token_status(status: TokenStatus) -> str:
+    """Render one service's token status as a markdown block."""
+    if status.is_valid:
+        header = f"✅ **{status.service_name}**: Valid"
+        if not status.details:
+            return header
+        return header + "".join(
+            f"\n   - {key}: {value}" for key, value in status.details.items()
+        )
+
+    icon = "❌" if status.is_required else "⚠️"
+    return (
+        f"{icon} **{status.service_name}**: {status.error_type}"
+        f"\n   - Error: {status.error_message}"
+        f"\n   - Help: {status.help_url}"
+    )
+
+
 async def _check_token_health() -> list[TextContent]:
     """Check health status of all API tokens."""
     try:
         token_service = TokenHealthService()
         token_statuses = await token_service.validate_all_tokens()
 
-        output = ["# API Token Health Status", ""]
-
+        # One block per service plus the overall verdict, computed in the
+        # same pass, separated by blank lines.
+        blocks = ["# API Token Health Status"]
+        all_required_valid = True
         for status in token_statuses:
-            if status.is_valid:
-                output.append(f"✅ **{status.service_name}**: Valid")
-                if status.details:
-                    for key, value in status.details.items():
-                        output.append(f"   - {key}: {value}")
-            else:
-                icon = "❌" if status.is_required else "⚠️"
-                output.append(f"{icon} **{status.service_name}**: {status.error_type}")
-                output.append(f"   - Error: {status.error_message}")
-                output.append(f"   - Help: {status.help_url}")
-            output.append("")
-
-        # Overall status
-        all_required_valid = all(
-            status.is_valid for status in token_statuses if status.is_required
-        )
+            blocks.append(_format_token_status(status))
+            if status.is_required and not status.is_valid:
+                all_required_valid = False
 
         if all_required_valid:
-            output.append("✅ **Overall Status:** All required services are configured correctly")
+            blocks.append("✅ **Overall Status:** All required services are configured correctly")
         else:
-            output.append("❌ **Overall Status:** Some required services have issues")
+            blocks.append("❌ **Overall Status:** Some required services have issues")
 
-        return [TextContent(type="text", text="\n".join(output))]
+        return [TextContent(type="text", text="\n\n".join(blocks))]
 
     except Exception as e:
         return [TextContent(
@@ -507,13 +700,6 @@ async def _check_token_health() -> list[TextContent]:
 
 def _validate_environment():
     """Validate that required environment variables are set."""
-    required_vars = {
-        "JIRA_URL": "Jira base URL (e.g., https://company.atlassian.net)",
-        "JIRA_USERNAME": "Jira account email",
-        "JIRA_API_TOKEN": "Jira API token",
-        "ANTHROPIC_API_KEY": "Anthropic/Claude API key",
-    }
-
     # Set default LLM provider and model if not set
     if not os.getenv("LLM_PROVIDER"):
         os.environ["LLM_PROVIDER"] = "claude"
@@ -521,7 +707,7 @@ def _validate_environment():
         os.environ["LLM_MODEL"] = "claude-opus-4-5-20251101"
 
     missing = []
-    for var, description in required_vars.items():
+    for var, description in _REQUIRED_VARS:
         if not os.getenv(var):
             missing.append(f"  - {var}: {description}")
 
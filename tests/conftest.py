@@ -0,0 +1,283 @@
+"""
+Shared fixtures for the test suite.
+
+The ADF description documents are large nested literals, so they're built
+once per session and shared by reference. Tests must treat them as
+read-only. Mocked Jira issue responses live pre-serialized under
+tests/fixtures/ and are read once per session as raw bytes.
+"""
+
+import re
+from pathlib import Path
+
+import httpx
+import pytest
+import pytest_asyncio
+import respx
+from fastapi.testclient import TestClient
+
+from src.app.config import settings
+from src.app.main import app
+
+# Fake Jira site the respx-mocked tests point JiraClient at
+JIRA_BASE_URL = "https://jira.example.test"
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# Compiled once per session rather than per jira_mock router
+_ISSUE_COMMENTS_PATH = re.compile(r"^/rest/api/3/issue/[^/]+/comment$")
+
+
+# Opt-in markers: marker name -> (command-line flag, skip reason)
+_GATED_MARKERS = {
+    "remote": ("--run-remote", "calls a live LLM; use --run-remote"),
+    "slow": ("--run-slow", "slow; use --run-slow"),
+}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-remote",
+        action="store_true",
+        default=False,
+        help="run tests marked remote, which call a live LLM provider",
+    )
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run tests marked slow (e.g. the nightly CI job)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip remote and slow tests unless their --run-* flag was given."""
+    for marker, (flag, reason) in _GATED_MARKERS.items():
+        if config.getoption(flag):
+            continue
+        skip = pytest.mark.skip(reason=reason)
+        for item in items:
+            if marker in item.keywords:
+                item.add_marker(skip)
+
+
+@pytest.fixture(autouse=True)
+def _fast_sleep(monkeypatch):
+    """Collapse Jira pacing and LLM retry backoff so mocked tests never wait."""
+
+    async def _noop(*args, **kwargs):
+        return None
+
+    monkeypatch.setattr("src.app.jira_client._sleep", _noop)
+    monkeypatch.setattr("src.app.llm_client._sleep", _noop)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """TestClient for the API, entered once so its event loop thread is reused."""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest_asyncio.fixture
+async def aclient():
+    """Async client calling the app in-process over ASGI, on the test's own event loop."""
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as c:
+        yield c
+
+
+@pytest.fixture
+def jira_mock(monkeypatch):
+    """
+    Point JiraClient at JIRA_BASE_URL and intercept its traffic with respx.
+
+    Yields the respx router with base_url set, so tests register Jira paths
+    directly, e.g. jira_mock.get("/rest/api/3/issue/TEST-123"). Requests
+    with no matching route fail the test. The issue fetch's secondary
+    lookups (dev-status, comments) default to "nothing there".
+    """
+    monkeypatch.setattr(settings, "jira_url", JIRA_BASE_URL)
+    with respx.mock(base_url=JIRA_BASE_URL, assert_all_called=False) as router:
+        router.get(path__startswith="/rest/dev-status/").mock(return_value=httpx.Response(404))
+        router.get(path__regex=_ISSUE_COMMENTS_PATH).mock(
+            return_value=httpx.Response(200, json={"comments": []})
+        )
+        yield router
+
+
+@pytest.fixture(scope="session")
+def good_issue_bytes() -> bytes:
+    """Story with a short ADF description holding one Given/When/Then criterion."""
+    return (FIXTURES_DIR / "good_issue.json").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def no_description_issue_bytes() -> bytes:
+    """Bug with no description and no labels."""
+    return (FIXTURES_DIR / "no_description_issue.json").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def weak_issue_bytes() -> bytes:
+    """Task whose whole description is "Make it blue"."""
+    return (FIXTURES_DIR / "weak_issue.json").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def acceptance_criteria_adf_doc() -> dict:
+    """User story with an "Acceptance Criteria" heading and bullet list."""
+    return {
+        "version": 1,
+        "type": "doc",
+        "content": [
+            {
+                "type": "paragraph",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": "As a user, I want to be able to reset my password so that I can regain access to my account if I forget it.",
+                    }
+                ],
+            },
+            {
+                "type": "heading",
+                "attrs": {"level": 2},
+                "content": [{"type": "text", "text": "Acceptance Criteria"}],
+            },
+            {
+                "type": "bulletList",
+                "content": [
+                    {
+                        "type": "listItem",
+                        "content": [
+                            {
+                                "type": "paragraph",
+                                "content": [
+                                    {
+                                        "type": "text",
+                                        "text": "User can click 'Forgot Password' link on login page",
+                                    }
+                                ],
+                            }
+                        ],
+                    },
+                    {
+                        "type": "listItem",
+                        "content": [
+                            {
+                                "type": "paragraph",
+                                "content": [
+                                    {
+                                        "type": "text",
+                                        "text": "System sends reset email to registered email address",
+                                    }
+                                ],
+                            }
+                        ],
+                    },
+                    {
+                        "type": "listItem",
+                        "content": [
+                            {
+                                "type": "paragraph",
+                                "content": [
+                                    {
+                                        "type": "text",
+                                        "text": "Reset link expires after 24 hours",
+                                    }
+                                ],
+                            }
+                        ],
+                    },
+                ],
+            },
+        ],
+    }
+
+
+@pytest.fixture(scope="session")
+def high_quality_adf_doc() -> dict:
+    """Description with acceptance criteria, Given/When/Then and test notes."""
+    return {
+        "version": 1,
+        "type": "doc",
+        "content": [
+            {
+                "type": "paragraph",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": "Implement a feature to export user data to CSV format for compliance reporting.",
+                    }
+                ],
+            },
+            {
+                "type": "heading",
+                "attrs": {"level": 3},
+                "content": [{"type": "text", "text": "Acceptance Criteria:"}],
+            },
+            {
+                "type": "bulletList",
+                "content": [
+                    {
+                        "type": "listItem",
+                        "content": [
+                            {
+                                "type": "paragraph",
+                                "content": [
+                                    {
+                                        "type": "text",
+                                        "text": "Given I am an admin user, when I click the Export button, then a CSV file should be downloaded",
+                                    }
+                                ],
+                            }
+                        ],
+                    },
+                    {
+                        "type": "listItem",
+                        "content": [
+                            {
+                                "type": "paragraph",
+                                "content": [
+                                    {
+                                        "type": "text",
+                                        "text": "The CSV must include user ID, name, email, and registration date",
+                                    }
+                                ],
+                            }
+                        ],
+                    },
+                    {
+                        "type": "listItem",
+                        "content": [
+                            {
+                                "type": "paragraph",
+                                "content": [
+                                    {
+                                        "type": "text",
+                                        "text": "Verify that sensitive data (passwords) are excluded from the export",
+                                    }
+                                ],
+                            }
+                        ],
+                    },
+                ],
+            },
+            {
+                "type": "heading",
+                "attrs": {"level": 3},
+                "content": [{"type": "text", "text": "Test Notes:"}],
+            },
+            {
+                "type": "paragraph",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": "Test with datasets of varying sizes (10, 100, 1000+ users). Ensure the expected behavior is maintained across all test environments.",
+                    }
+                ],
+            },
+        ],
+    }
@@ -1,5 +1,5 @@
 """
-Simple test runner - no pytest required.
+Simple test runner for the ADF parser and description analyzer checks.
 
 Run this to test all functionality with dummy data.
 """
@@ -7,27 +7,24 @@ Run this to test all functionality with dummy data.
 import sys
 from pathlib import Path
 
-# Add project root to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+import pytest
 
 print("=" * 80)
 print("TESTING JIRA TEST PLAN BOT - ADF PARSER & DESCRIPTION ANALYZER")
 print("=" * 80)
 print()
 
-try:
-    # Run the manual tests
-    test_file = Path(__file__).parent / "test_manual.py"
-    exec(open(test_file).read())
-    print("\n✅ All ADF parsing and description analysis tests passed!")
-
-except Exception as e:
-    print(f"\n❌ Test failed with error: {e}")
-    import traceback
-
-    traceback.print_exc()
-    sys.exit(1)
+# Run the ADF parser and description analyzer cases (the ADF documents come from conftest.py fixtures)
+tests_dir = Path(__file__).parent
+exit_code = pytest.main([
+    "-q",
+    str(tests_dir / "test_adf_parser.py"),
+    str(tests_dir / "test_description_analyzer.py"),
+])
+if exit_code != 0:
+    print("\n❌ ADF parsing and description analysis tests failed")
+    sys.exit(exit_code)
+print("\n✅ All ADF parsing and description analysis tests passed!")
 
 print("\n" + "=" * 80)
 print("TESTING COMPLETE")
@@ -1,9 +1,67 @@
 """
 Test ADF parser functionality, especially strikethrough text handling.
+
+These cases exercise extract_text_from_adf alone; analysis of the extracted
+text is covered in test_description_analyzer.py.
 """
 
+import pytest
+
 from src.app.adf_parser import extract_text_from_adf
 
+# (case id, ADF payload, expected extracted text)
+EXTRACT_CASES = [
+    ("none", None, ""),
+    ("empty_string", "", ""),
+    ("plain_string", "  Update the login button color.\n", "Update the login button color."),
+    ("empty_doc", {"type": "doc", "version": 1, "content": []}, ""),
+    ("doc_without_content", {"type": "doc", "version": 1}, ""),
+    ("paragraph_without_content", {"type": "doc", "content": [{"type": "paragraph"}]}, ""),
+    ("content_is_string", {"type": "doc", "content": "stray text"}, "stray text"),
+    ("not_a_dict", ["a", "b"], "['a', 'b']"),
+]
+
+# (case id, name of the session-scoped ADF fixture in conftest.py, expected extracted text)
+ADF_DOC_CASES = [
+    (
+        "adf_with_ac",
+        "acceptance_criteria_adf_doc",
+        "As a user, I want to be able to reset my password so that I can regain access to my account if I forget it.\n\n"
+        "Acceptance Criteria\n\n"
+        "• \nUser can click 'Forgot Password' link on login page\n\n"
+        "• \nSystem sends reset email to registered email address\n\n"
+        "• \nReset link expires after 24 hours",
+    ),
+    (
+        "high_quality_adf",
+        "high_quality_adf_doc",
+        "Implement a feature to export user data to CSV format for compliance reporting.\n\n"
+        "Acceptance Criteria:\n\n"
+        "• \nGiven I am an admin user, when I click the Export button, then a CSV file should be downloaded\n\n"
+        "• \nThe CSV must include user ID, name, email, and registration date\n\n"
+        "• \nVerify that sensitive data (passwords) are excluded from the export\n\n\n"
+        "Test Notes:\n\n"
+        "Test with datasets of varying sizes (10, 100, 1000+ users). "
+        "Ensure the expected behavior is maintained across all test environments.",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "name,payload,expected", EXTRACT_CASES, ids=[case[0] for case in EXTRACT_CASES]
+)
+def test_extract_text_from_adf(name, payload, expected):
+    """Empty, plain-string and malformed payloads flatten to the expected text."""
+    assert extract_text_from_adf(payload) == expected
+
+
+@pytest.mark.parametrize(
+    "name,fixture_name,expected", ADF_DOC_CASES, ids=[case[0] for case in ADF_DOC_CASES]
+)
+def test_extract_text_from_adf_doc(name, fixture_name, expected, request):
+    """Rich ADF documents flatten into paragraphs, headings and bullets in order."""
+    assert extract_text_from_adf(request.getfixturevalue(fixture_name)) == expected
+
 
 def test_strikethrough_text_is_ignored():
     """Test that strikethrough text is excluded from extracted text."""
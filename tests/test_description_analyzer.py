@@ -0,0 +1,108 @@
+"""
+Description completeness checks on plain text.
+
+Inputs are already-extracted strings, so these cases exercise
+analyze_description alone; ADF flattening is covered in test_adf_parser.py.
+"""
+
+import pytest
+
+from src.app.description_analyzer import analyze_description
+
+NO_AC_TEXT = """
+The dashboard is loading slowly for users with large datasets.
+This is impacting user experience and causing complaints from customers.
+We need to optimize the database queries and implement caching.
+"""
+
+AC_HEADING_TEXT = """As a user, I want to reset my password.
+
+Acceptance Criteria
+
+• User can click 'Forgot Password' link on login page
+• Reset link expires after 24 hours"""
+
+GIVEN_WHEN_THEN_TEXT = (
+    "Given I am an admin user, when I click the Export button, "
+    "then a CSV file should be downloaded"
+)
+
+BUG_REPORT_TEXT = """Steps to reproduce: open the dashboard with 10k rows
+Expected result: it loads in under 2s
+Actual: it times out"""
+
+# (case id, description, issue type, expected analysis fields)
+CASES = [
+    (
+        "none",
+        None,
+        None,
+        {"has_description": False, "gaps": ["Missing description"], "char_count": 0, "word_count": 0},
+    ),
+    (
+        "whitespace_only",
+        "   \n ",
+        None,
+        {"has_description": False, "gaps": ["Missing description"], "char_count": 0, "word_count": 0},
+    ),
+    (
+        "plain_string",
+        "This is a simple bug fix. Update the login button color.",
+        None,
+        {"has_description": True, "gaps": ["Missing acceptance criteria"], "char_count": 56, "word_count": 11},
+    ),
+    (
+        "very_short",
+        "Fix bug",
+        None,
+        {"has_description": True, "gaps": ["Missing acceptance criteria"], "char_count": 7, "word_count": 2},
+    ),
+    (
+        "no_acceptance_criteria",
+        NO_AC_TEXT,
+        None,
+        {"has_description": True, "gaps": ["Missing acceptance criteria"], "char_count": 199, "word_count": 30},
+    ),
+    (
+        "acceptance_criteria_heading",
+        AC_HEADING_TEXT,
+        "Story",
+        {"has_description": True, "gaps": [], "char_count": 151, "word_count": 28},
+    ),
+    (
+        "given_when_then",
+        GIVEN_WHEN_THEN_TEXT,
+        "Story",
+        {"has_description": True, "gaps": [], "char_count": 94, "word_count": 19},
+    ),
+    (
+        "bug_with_repro_and_expected",
+        BUG_REPORT_TEXT,
+        "Bug",
+        {"has_description": True, "gaps": [], "char_count": 111, "word_count": 20},
+    ),
+    (
+        "bug_without_repro",
+        "Login breaks",
+        "Bug",
+        {
+            "has_description": True,
+            "gaps": ["Missing reproduction steps", "Missing expected vs. actual behavior"],
+            "char_count": 12,
+            "word_count": 2,
+        },
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "name,description,issue_type,expected", CASES, ids=[case[0] for case in CASES]
+)
+def test_analyze_description(name, description, issue_type, expected):
+    """Plain-text descriptions are analyzed into the expected completeness result."""
+    analysis = analyze_description(description, issue_type)
+
+    assert analysis.has_description is expected["has_description"]
+    assert analysis.gaps == expected["gaps"]
+    assert analysis.char_count == expected["char_count"]
+    assert analysis.word_count == expected["word_count"]
@@ -5,8 +5,10 @@ This tests the smart comment management feature that updates existing
 test plan comments instead of creating duplicates.
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import json
+from unittest.mock import patch
 
+import httpx
 import pytest
 
 from src.app.jira_client import (
@@ -16,166 +18,114 @@ from src.app.jira_client import (
     markdown_to_adf,
 )
 
+# Jira's reply to a comment create, serialized once for every create route
+_CREATE_RESP = {"id": "12345", "body": {"type": "doc", "version": 1, "content": []}}
+_CREATE_RESP_BYTES = json.dumps(_CREATE_RESP).encode()
+_JSON_HEADERS = {"content-type": "application/json"}
 
-@pytest.mark.asyncio
-async def test_post_comment_creates_new_when_none_exists():
-    """Test that posting creates a new comment when none exists."""
-    jira = JiraClient()
 
-    # Mock get_comments to return empty list (no existing comments)
-    with patch.object(jira, 'get_comments', return_value=[]):
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_response = MagicMock()
-            mock_response.status_code = 201
-            mock_response.json.return_value = {
-                "id": "12345",
-                "body": {"type": "doc", "version": 1, "content": []}
-            }
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-                return_value=mock_response
-            )
+def _async_stub(result=None, exc=None):
+    """
+    Plain coroutine function standing in for a JiraClient method.
 
-            result = await jira.post_comment("TEST-123", "Test plan content")
+    Cheaper than the AsyncMock patch.object would create; calls are
+    recorded on stub.calls as (args, kwargs).
+    """
+    calls = []
 
-            assert result["id"] == "12345"
-            assert result["updated"] is False
+    async def stub(*args, **kwargs):
+        calls.append((args, kwargs))
+        if exc is not None:
+            raise exc
+        return result
 
+    stub.calls = calls
+    return stub
 
-@pytest.mark.asyncio
-async def test_post_comment_updates_existing():
-    """Test that posting updates existing test plan comment."""
-    jira = JiraClient()
 
-    # Mock get_comments to return existing test plan comment
-    existing_comment = {
-        "id": "67890",
+def _comment(comment_id: str, text: str) -> dict:
+    return {
+        "id": comment_id,
         "body": {
             "type": "doc",
             "version": 1,
-            "content": [
-                {
-                    "type": "paragraph",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": "🤖 Generated Test Plan\n\nOld content"
-                        }
-                    ]
-                }
-            ]
-        }
+            "content": [{"type": "paragraph", "content": [{"type": "text", "text": text}]}],
+        },
     }
 
-    with patch.object(jira, 'get_comments', return_value=[existing_comment]):
-        with patch.object(jira, 'update_comment') as mock_update:
-            mock_update.return_value = {
-                "id": "67890",
-                "body": {"type": "doc", "version": 1, "content": []}
-            }
-
-            result = await jira.post_comment("TEST-123", "New test plan content")
 
-            # Verify update was called instead of create
-            mock_update.assert_called_once()
-            assert result["updated"] is True
-            assert result["id"] == "67890"
+# (scenario id, existing comments or the exception get_comments raises,
+#  whether the existing comment is updated, id of the resulting comment)
+SCENARIOS = [
+    ("creates_new_when_none_exists", [], False, "12345"),
+    (
+        "updates_existing",
+        [_comment("67890", "🤖 Generated Test Plan\n\nOld content")],
+        True,
+        "67890",
+    ),
+    (
+        "creates_new_when_marker_not_found",
+        [_comment("11111", "Regular comment without marker")],
+        False,
+        "12345",
+    ),
+    # Checking existing comments fails, so it falls back to creating one
+    ("fallback_on_error", Exception("API error"), False, "12345"),
+]
+
+
+@pytest.fixture
+def jira(jira_mock):
+    """JiraClient pointed at the respx-mocked Jira site."""
+    return JiraClient()
 
 
 @pytest.mark.asyncio
-async def test_post_comment_creates_new_when_marker_not_found():
-    """Test that posting creates new comment when marker is not found in existing comments."""
-    jira = JiraClient()
-
-    # Mock get_comments to return comments without marker
-    existing_comment = {
-        "id": "11111",
-        "body": {
-            "type": "doc",
-            "version": 1,
-            "content": [
-                {
-                    "type": "paragraph",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": "Regular comment without marker"
-                        }
-                    ]
-                }
-            ]
-        }
-    }
-
-    with patch.object(jira, 'get_comments', return_value=[existing_comment]):
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_response = MagicMock()
-            mock_response.status_code = 201
-            mock_response.json.return_value = {
-                "id": "22222",
-                "body": {"type": "doc", "version": 1, "content": []}
-            }
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-                return_value=mock_response
-            )
+@pytest.mark.parametrize("scenario", SCENARIOS, ids=lambda s: s[0])
+async def test_post_comment_scenarios(jira, jira_mock, scenario):
+    """post_comment updates the existing test plan comment, or creates a new one."""
+    _, existing, expected_updated, expected_id = scenario
+    if isinstance(existing, Exception):
+        get_comments = _async_stub(exc=existing)
+    else:
+        get_comments = _async_stub(existing)
+    update_comment = _async_stub(
+        {"id": expected_id, "body": {"type": "doc", "version": 1, "content": []}}
+    )
+    create_route = jira_mock.post("/rest/api/3/issue/TEST-123/comment").mock(
+        return_value=httpx.Response(201, content=_CREATE_RESP_BYTES, headers=_JSON_HEADERS)
+    )
 
-            result = await jira.post_comment("TEST-123", "Test plan content")
+    with patch.object(jira, 'get_comments', new=get_comments), \
+            patch.object(jira, 'update_comment', new=update_comment):
+        result = await jira.post_comment("TEST-123", "Test plan content")
 
-            # Should create new comment since marker wasn't found
-            assert result["id"] == "22222"
-            assert result["updated"] is False
+    assert result["id"] == expected_id
+    assert result["updated"] is expected_updated
+    # Exactly one of update / create happened
+    assert len(update_comment.calls) == (1 if expected_updated else 0)
+    assert create_route.call_count == (0 if expected_updated else 1)
 
 
 @pytest.mark.asyncio
-async def test_post_comment_includes_marker():
+async def test_post_comment_includes_marker(jira, jira_mock):
     """Test that posted comment includes the marker for future identification."""
-    jira = JiraClient()
-
-    with patch.object(jira, 'get_comments', return_value=[]):
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_response = MagicMock()
-            mock_response.status_code = 201
-            mock_response.json.return_value = {"id": "12345"}
-            mock_post = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.post = mock_post
-
-            await jira.post_comment("TEST-123", "Test plan content")
-
-            # Verify the posted payload includes the marker (in content[0]) and
-            # the comment body (wrapped in an expand block at content[1]).
-            import json as _json
-
-            call_args = mock_post.call_args
-            payload = call_args.kwargs['json']
-            marker_text = payload['body']['content'][0]['content'][0]['text']
-            full_body = _json.dumps(payload['body'])
+    route = jira_mock.post("/rest/api/3/issue/TEST-123/comment").mock(
+        return_value=httpx.Response(201, content=_CREATE_RESP_BYTES, headers=_JSON_HEADERS)
+    )
 
-            assert "🤖 Generated Test Plan" in marker_text
-            assert "Test plan content" in full_body
+    with patch.object(jira, 'get_comments', new=_async_stub([])):
+        await jira.post_comment("TEST-123", "Test plan content")
 
+        # Verify the posted payload includes the marker (in content[0]) and
+        # the comment body (wrapped in an expand block at content[1]).
+        payload = json.loads(route.calls.last.request.content)
+        marker_text = payload['body']['content'][0]['content'][0]['text']
+        full_body = json.dumps(payload['body'])
 
-@pytest.mark.asyncio
-async def test_post_comment_fallback_on_error():
-    """Test that posting falls back to creating new comment if checking fails."""
-    jira = JiraClient()
-
-    # Mock get_comments to raise an exception
-    with patch.object(jira, 'get_comments', side_effect=Exception("API error")):
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_response = MagicMock()
-            mock_response.status_code = 201
-            mock_response.json.return_value = {
-                "id": "12345",
-                "body": {"type": "doc", "version": 1, "content": []}
-            }
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-                return_value=mock_response
-            )
-
-            # Should still succeed by creating new comment
-            result = await jira.post_comment("TEST-123", "Test plan content")
-
-            assert result["id"] == "12345"
-            assert result["updated"] is False
+        assert "🤖 Generated Test Plan" in marker_text
+        assert "Test plan content" in full_body
 
 
 def test_wrap_body_in_expand_collapses_each_test_case():
@@ -228,8 +178,7 @@ def test_wrap_body_in_expand_collapses_each_test_case():
     )
     assert "verify SSO" in regression_text
     # And no leftover ── divider paragraphs anywhere in the body.
-    import json as _json
-    body = _json.dumps(wrapped)
+    body = json.dumps(wrapped)
     assert "────" not in body
 
 
@@ -5,16 +5,33 @@ Run this to verify your LLM setup is working correctly.
 """
 
 import asyncio
+import json
 import sys
-from pathlib import Path
+from unittest.mock import AsyncMock
 
 import pytest
 
-# Add project root to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+from src.app.config import settings
+from src.app.llm_client import get_llm_client, LLMError, OllamaClient, _is_observability_ticket
+from src.app.models import TestPlan as _TestPlan
 
-from src.app.llm_client import get_llm_client, LLMError, _is_observability_ticket
+# Mock ticket data shared by the live and mocked generation tests
+SAMPLE_TICKET = {
+    "ticket_key": "TEST-123",
+    "summary": "Add password reset functionality",
+    "description": """Users should be able to reset their password via email.
+
+Acceptance Criteria:
+- Given a user clicks 'Forgot Password', when they enter their email, then they receive a reset link
+- Given a user clicks the reset link, when they enter a new password, then their password is updated
+- Given the reset link is older than 24 hours, when they click it, then they see an expired message
+""",
+    "testing_context": {
+        "testDataNotes": "Test with valid and invalid email addresses",
+        "rolesPermissions": "Any authenticated user",
+        "riskAreas": "Email delivery, security token generation",
+    },
+}
 
 
 class TestObservabilityDetector:
@@ -58,69 +75,60 @@ class TestObservabilityDetector:
 
 
 @pytest.mark.asyncio
-@pytest.mark.skip(reason="Manual integration test — requires a running LLM provider. Run directly: python tests/test_llm.py")
+@pytest.mark.remote
+@pytest.mark.slow
 async def test_llm_generation():
-    """Test generating a test plan with mock data."""
-    print("=" * 80)
-    print("TESTING LLM TEST PLAN GENERATION")
-    print("=" * 80)
-    print()
+    """Generating a test plan for the sample ticket against the configured LLM succeeds."""
+    test_plan = await get_llm_client().generate_test_plan(**SAMPLE_TICKET)
 
-    # Mock ticket data
-    ticket_key = "TEST-123"
-    summary = "Add password reset functionality"
-    description = """Users should be able to reset their password via email.
+    assert isinstance(test_plan, _TestPlan)
+    assert test_plan.happy_path, "LLM returned no happy path test cases"
 
-Acceptance Criteria:
-- Given a user clicks 'Forgot Password', when they enter their email, then they receive a reset link
-- Given a user clicks the reset link, when they enter a new password, then their password is updated
-- Given the reset link is older than 24 hours, when they click it, then they see an expired message
-"""
-    testing_context = {
-        "testDataNotes": "Test with valid and invalid email addresses",
-        "rolesPermissions": "Any authenticated user",
-        "riskAreas": "Email delivery, security token generation",
-    }
 
+@pytest.mark.asyncio
+async def test_llm_generation_mocked(monkeypatch):
+    """The configured client is used for generation; the provider call itself is stubbed."""
+    canned = _TestPlan(
+        happy_path=[
+            {
+                "title": "Reset password via emailed link",
+                "steps": ["Click 'Forgot Password'", "Enter email", "Open reset link"],
+                "expected": "Password is updated",
+            }
+        ],
+        edge_cases=[{"title": "Expired reset link", "steps": ["Open a 25h-old link"], "expected": "Expired message"}],
+        regression_checklist=["Login with the old password fails"],
+    )
+    mock_generate = AsyncMock(return_value=canned)
+    monkeypatch.setattr(settings, "llm_provider", "ollama")
+    monkeypatch.setattr(OllamaClient, "generate_test_plan", mock_generate)
+
+    llm = get_llm_client()
+    test_plan = await llm.generate_test_plan(**SAMPLE_TICKET)
+
+    assert isinstance(llm, OllamaClient)
+    assert test_plan is canned
+    mock_generate.assert_awaited_once_with(**SAMPLE_TICKET)
+
+
+async def _check_llm_setup() -> bool:
+    """Script entry point: run one live generation and explain any failure."""
     try:
         llm = get_llm_client()
-        print(f"✓ Using LLM client: {llm.__class__.__name__}")
-        print(f"✓ Generating test plan for ticket: {ticket_key}")
-        print(f"✓ Summary: {summary}")
-        print()
-        print("⏳ Calling LLM... (this may take 30-120 seconds)")
-        print()
-
-        test_plan = await llm.generate_test_plan(
-            ticket_key=ticket_key,
-            summary=summary,
-            description=description,
-            testing_context=testing_context,
-        )
-
-        print("=" * 80)
-        print("✅ TEST PLAN GENERATED SUCCESSFULLY!")
-        print("=" * 80)
-        print()
-
-        print(f"📝 Happy Path Test Cases: {len(test_plan.happy_path)}")
-        for i, test in enumerate(test_plan.happy_path, 1):
-            print(f"\n  {i}. {test.get('title', 'Untitled')}")
-            print(f"     Steps: {len(test.get('steps', []))}")
-            print(f"     Expected: {test.get('expected', 'N/A')[:60]}...")
-
-        print(f"\n🔍 Edge Cases: {len(test_plan.edge_cases)}")
-        for i, test in enumerate(test_plan.edge_cases, 1):
-            print(f"  {i}. {test.get('title', 'Untitled')}")
-
-        print(f"\n🔄 Regression Checklist: {len(test_plan.regression_checklist)} items")
-        for item in test_plan.regression_checklist[:3]:
-            print(f"  - {item}")
-
-        print()
-        print("=" * 80)
-        print("✅ LLM integration test passed!")
-        print("=" * 80)
+        test_plan = await llm.generate_test_plan(**SAMPLE_TICKET)
+
+        # Only render the summary for a human at a terminal
+        if sys.stdout.isatty():
+            summary = {
+                "llm_client": llm.__class__.__name__,
+                "ticket_key": SAMPLE_TICKET["ticket_key"],
+                "happy_path": len(test_plan.happy_path),
+                "edge_cases": len(test_plan.edge_cases),
+                "regression_checklist": len(test_plan.regression_checklist),
+                "first_titles": [t.get("title", "Untitled") for t in test_plan.happy_path[:3]],
+                "first_checklist_items": test_plan.regression_checklist[:3],
+            }
+            print(json.dumps(summary, indent=2, ensure_ascii=False))
         return True
 
     except LLMError as e:
@@ -158,5 +166,5 @@ Acceptance Criteria:
 
 
 if __name__ == "__main__":
-    success = asyncio.run(test_llm_generation())
+    success = asyncio.run(_check_llm_setup())
     sys.exit(0 if success else 1)
@@ -0,0 +1,115 @@
+"""
+Test the MCP server's short-lived ticket cache and per-key fetch coalescing.
+
+JiraClient is replaced by a stub whose fetches take a little real time, so
+overlapping tool calls for the same ticket actually contend for its lock.
+"""
+
+import asyncio
+from collections import Counter, OrderedDict, defaultdict
+
+import pytest
+
+from src.mcp_server import server
+
+FETCH_SECONDS = 0.05
+
+
+class _StubJira:
+    """Counts get_issue calls and the most that ran at once; fails the first `failures`."""
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.fetches = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_issue(self, ticket_key: str):
+        self.fetches += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(FETCH_SECONDS)
+            if self.fetches <= self.failures:
+                raise RuntimeError("Jira hiccup")
+            return f"issue:{ticket_key}"
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def stub_jira(monkeypatch):
+    """Fresh, empty cache state with _get_issue fetching through a _StubJira."""
+    monkeypatch.setattr(server, "_issue_cache", OrderedDict())
+    monkeypatch.setattr(server, "_issue_locks", defaultdict(asyncio.Lock))
+    monkeypatch.setattr(server, "_issue_lock_users", Counter())
+    stub = _StubJira()
+    monkeypatch.setattr(server, "_get_jira_client", lambda: stub)
+    return stub
+
+
+async def _call_after(delay: float, ticket_key: str):
+    await asyncio.sleep(delay)
+    return await server._get_issue(ticket_key)
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_does_not_split_waiters_across_locks(stub_jira):
+    """After a failed fetch, the queued and newly arriving callers still share one fetch."""
+    stub_jira.failures = 1
+
+    results = await asyncio.gather(
+        *(_call_after(delay, "K-1") for delay in (0, 0.01, 0.06, 0.07)),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], RuntimeError)
+    assert results[1:] == ["issue:K-1"] * 3
+    assert stub_jira.fetches == 2
+    assert stub_jira.max_in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_fetch_and_reuse_the_cache(stub_jira):
+    """Overlapping calls coalesce, and a later call inside the TTL is served from cache."""
+    first = await asyncio.gather(*(server._get_issue("K-1") for _ in range(3)))
+    again = await server._get_issue("K-1")
+
+    assert first == ["issue:K-1"] * 3
+    assert again == "issue:K-1"
+    assert stub_jira.fetches == 1
+
+
+@pytest.mark.asyncio
+async def test_locks_are_released_once_unused(stub_jira):
+    """Failed keys leave no lock or user count behind; cached keys keep their lock."""
+    stub_jira.failures = 1
+
+    with pytest.raises(RuntimeError):
+        await server._get_issue("K-1")
+    await server._get_issue("K-2")
+
+    assert "K-1" not in server._issue_locks
+    assert "K-2" in server._issue_locks
+    assert not server._issue_lock_users
+
+
+@pytest.mark.asyncio
+async def test_eviction_keeps_a_lock_that_is_still_waited_on(stub_jira, monkeypatch):
+    """Evicting a key whose lock has waiters doesn't let a new caller fetch alongside them."""
+    monkeypatch.setattr(server, "_ISSUE_CACHE_MAX_ENTRIES", 1)
+    await server._get_issue("K-1")
+
+    # K-2 evicts K-1 while a K-1 caller waits on its (stale-cache) lock
+    lock = server._issue_locks["K-1"]
+    await lock.acquire()
+    waiter = asyncio.create_task(server._get_issue("K-1"))
+    await asyncio.sleep(0)
+    await server._get_issue("K-2")
+    assert server._issue_locks["K-1"] is lock
+
+    lock.release()
+    late = asyncio.create_task(_call_after(0.01, "K-1"))
+    assert await asyncio.gather(waiter, late) == ["issue:K-1"] * 2
+    assert stub_jira.fetches == 3
+    assert stub_jira.max_in_flight == 1
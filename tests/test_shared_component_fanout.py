@@ -20,17 +20,12 @@ Layers exercised:
 from __future__ import annotations
 
 import asyncio
-import sys
-from pathlib import Path
 
 import pytest
 
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
-from src.app.llm_client import OllamaClient, _merge_fanout_contexts  # noqa: E402
-from src.app.models import TestPlan  # noqa: E402
-from src.app.shared_component_fanout import (  # noqa: E402
+from src.app.llm_client import OllamaClient, _merge_fanout_contexts
+from src.app.models import TestPlan
+from src.app.shared_component_fanout import (
     KNOWN_ROLES,
     ROLE_CONSUMPTION_MAP,
     FanoutContext,